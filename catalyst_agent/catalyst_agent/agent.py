@@ -10,13 +10,14 @@ import os
 import json
 import time
 import uuid
+import hashlib
 import logging
 import textwrap
 from typing import Dict, List, Optional, Any, Union, Callable
 
 from .config import AgentConfig
 from .memory import MemoryManager
-from .planning import Plan, PlanStep, PlanStatus, Planner, Executor, PlanningEngine
+from .planning import Plan, PlanStep, PlanStatus, Planner, Executor, PlanningEngine, PlanCache
 from .tools import Tool, ToolResult, ToolRegistry, discover_tools, instantiate_tool
 from .utils import setup_logger, ensure_directory_exists
 from .llm import LLMManager
@@ -41,6 +42,19 @@ class LLMPlanner(Planner):
         # Create a new plan
         plan = Plan(goal=goal)
         
+        # Without any tools the only possible plan is a direct language response,
+        # so skip the LLM planning round trip entirely
+        if not context.get('available_tools'):
+            self.logger.info("No tools available, answering directly without a planning call")
+            plan.metadata['reasoning'] = (
+                "No tools are available, so the request is answered directly through language generation."
+            )
+            plan.add_step(PlanStep(
+                description="Analyze the request and respond to the user",
+                tool_name=None
+            ))
+            return plan
+        
         # Make sure the config metadata is directly accessible in the context
         if 'config' in context and 'metadata' in context['config']:
             # Extract metadata
@@ -48,7 +62,7 @@ class LLMPlanner(Planner):
             # Add metadata directly to the top level of context for easier access
             for key, value in metadata.items():
                 context[key] = value
-            self.logger.info(f"Extracted metadata to context: {metadata}")
+            self.logger.info("Extracted metadata to context: %s", metadata)
         
         # Use the LLM manager to generate a plan
         try:
@@ -58,24 +72,10 @@ class LLMPlanner(Planner):
             if 'plan' in plan_data and isinstance(plan_data['plan'], list):
                 # Add steps from the generated plan
                 for step_data in plan_data['plan']:
-                    description = step_data.get('description', 'Unknown step')
-                    tool_name = step_data.get('tool_name')
-                    tool_args = step_data.get('tool_args', {})
-                    
-                    # Skip None or empty tool names
-                    if tool_name in [None, "", "null", "None"]:
-                        tool_name = None
-                    
-                    # Skip None tool args
-                    if tool_args in [None, "null", "None"]:
-                        tool_args = {}
-                    
-                    # Add the step to the plan
-                    plan.add_step(PlanStep(
-                        description=description,
-                        tool_name=tool_name,
-                        tool_args=tool_args
-                    ))
+                    try:
+                        plan.add_step(PlanStep.from_dict(step_data, as_new=True))
+                    except ValueError as e:
+                        self.logger.warning(f"Ignoring malformed plan step: {e}")
                 
                 # Store the reasoning in the plan's metadata for use in response generation
                 if 'reasoning' in plan_data:
@@ -100,7 +100,7 @@ class LLMPlanner(Planner):
                     ))
             else:
                 # If the plan structure is invalid, create a fallback plan
-                self.logger.warning(f"Invalid plan structure: {plan_data}")
+                self.logger.warning("Invalid plan structure: %s", plan_data)
                 plan.add_step(PlanStep(
                     description="Analyze the request and respond to the user",
                     tool_name=None
@@ -176,6 +176,7 @@ class AgentExecutor(Executor):
                             self.logger.info("Recovery step succeeded, retrying original step")
                             # Retry the original step
                             result = tool_registry.execute_tool(step.tool_name, **step.tool_args)
+                            step.metadata['recovered'] = True
                         else:
                             self.logger.info(f"Recovery step failed: {recovery_result.error}")
                     else:
@@ -212,6 +213,7 @@ class AgentExecutor(Executor):
                             step.tool_args["code"] = fixed_code
                             self.logger.info("Retrying with fixed code...")
                             result = tool_registry.execute_tool(step.tool_name, **step.tool_args)
+                            step.metadata['recovered'] = True
                 
                 # Store the result
                 step.result = result.data if result.success else None
@@ -297,6 +299,9 @@ class AgentCore:
         # Set up LLM manager
         self.llm_manager = LLMManager(self.config, self.event_queue)
         
+        # (hash of summarized turns, summary) for the compacted conversation history
+        self._history_summary = None
+        
         # Automatically discover and register tools if enabled
         if self.config.tool_discovery_enabled:
             self.logger.info("Tool discovery is enabled. Discovering available tools...")
@@ -326,7 +331,15 @@ class AgentCore:
         # Set up planning engine
         self.planner = LLMPlanner(self)
         self.executor = AgentExecutor(self)
-        self.planning_engine = PlanningEngine(self.planner, self.executor, self.llm_manager)
+        plan_cache = (PlanCache(self.config.plan_cache_size, storage_path=self.config.plan_cache_path)
+                      if self.config.plan_cache_enabled else None)
+        self.planning_engine = PlanningEngine(
+            self.planner, 
+            self.executor, 
+            self.llm_manager, 
+            plan_cache=plan_cache,
+            reeval_every_n=self.config.reeval_every_n
+        )
     
     def process_message(self, message: str, sender: str = "user", conversation_history: Optional[List[Dict]] = None) -> str:
         """ Process an incoming message and generate a response, optionally using provided history. """
@@ -351,7 +364,7 @@ class AgentCore:
         # Use provided history if available, otherwise use internal memory
         history_for_context = conversation_history if conversation_history is not None else self.memory.get_conversation_history()
         # Convert history to text format if needed by the LLM/planner
-        history_text = "\n".join([f"{msg.sender}: {msg.content}" for msg in history_for_context])
+        history_text = self._format_history(history_for_context)
 
         context = {
             'conversation_history': history_text,
@@ -390,6 +403,45 @@ class AgentCore:
         
         return response
     
+    def _format_history(self, messages: List[Any]) -> str:
+        """
+        Format conversation history for the prompts, compacting it once it gets long.
+        
+        The most recent messages are always kept verbatim. When the whole history
+        exceeds ``config.history_max_tokens``, older messages are replaced by an LLM
+        summary. Older turns are summarized in blocks of ``history_keep_recent``
+        messages, so the summary only changes (and is only regenerated) once per
+        block rather than on every turn.
+        
+        Args:
+            messages: Conversation messages, oldest first
+            
+        Returns:
+            History text for the prompt templates
+        """
+        lines = [f"{msg.sender}: {msg.content}" for msg in messages]
+        history_text = "\n".join(lines)
+        
+        keep = max(self.config.history_keep_recent, 1)
+        max_tokens = self.config.history_max_tokens
+        if (max_tokens <= 0 or len(lines) <= keep
+                or self.llm_manager.estimate_tokens(history_text) <= max_tokens):
+            return history_text
+        
+        split = ((len(lines) - keep) // keep) * keep
+        if split == 0:
+            return history_text
+        older = "\n".join(lines[:split])
+        key = hashlib.sha256(older.encode("utf-8")).hexdigest()
+        if self._history_summary is None or self._history_summary[0] != key:
+            summary = self.llm_manager.summarize_history(older)
+            if not summary:
+                return history_text
+            self._history_summary = (key, summary)
+            self.logger.info(f"Summarized {split} older messages of the conversation history")
+        
+        return "\n".join([f"Summary of earlier conversation: {self._history_summary[1]}"] + lines[split:])
+    
     def can_accomplish(self, task: str) -> Dict[str, Any]:
         """ Evaluate if a task can be accomplished with the current tools. """
         
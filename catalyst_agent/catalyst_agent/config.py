@@ -23,10 +23,16 @@ class AgentConfig:
     planning_enabled: bool = True
     self_improvement_enabled: bool = False
     verbose: bool = False
+    plan_cache_enabled: bool = False  # Reuse plans of previously completed goals
+    plan_cache_size: int = 128
+    plan_cache_path: Optional[str] = None  # JSON file the plan cache is persisted to
+    reeval_every_n: int = 1  # Reevaluate the plan after every N successful steps
     
     # Memory configuration
     short_term_memory_capacity: int = 10  # Number of recent interactions to keep
     long_term_memory_enabled: bool = True
+    history_max_tokens: int = 0  # Summarize older turns once the history exceeds this (0 disables)
+    history_keep_recent: int = 6  # Number of most recent messages always kept verbatim
     
     # Tool configuration
     available_tools: List[str] = field(default_factory=list)
@@ -49,8 +55,14 @@ class AgentConfig:
             "planning_enabled": self.planning_enabled,
             "self_improvement_enabled": self.self_improvement_enabled,
             "verbose": self.verbose,
+            "plan_cache_enabled": self.plan_cache_enabled,
+            "plan_cache_size": self.plan_cache_size,
+            "plan_cache_path": self.plan_cache_path,
+            "reeval_every_n": self.reeval_every_n,
             "short_term_memory_capacity": self.short_term_memory_capacity,
             "long_term_memory_enabled": self.long_term_memory_enabled,
+            "history_max_tokens": self.history_max_tokens,
+            "history_keep_recent": self.history_keep_recent,
             "available_tools": self.available_tools,
             "tool_discovery_enabled": self.tool_discovery_enabled,
             "custom_parameters": self.custom_parameters,
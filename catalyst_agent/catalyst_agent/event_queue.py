@@ -20,6 +20,7 @@ class EventType(Enum):
     PLAN_GENERATION = "plan_generation"
     TOOL_INPUT = "tool_input"
     TOOL_OUTPUT = "tool_output"
+    TOOL_INVOCATION = "tool_invocation"
     PLAN_CHANGE = "plan_change"
     EXECUTION_STEP = "execution_step"
     TOOL_ERROR = "tool_error"
@@ -58,15 +59,24 @@ class Event:
         }
     
     def to_json(self) -> str:
-        """Convert the event to a JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        """Convert the event to a compact JSON string (used for SSE frames)."""
+        return json.dumps(self.to_dict(), default=str, separators=(',', ':'))
 
 
 class EventQueue:
     """ A simple queue to store event data for the Catalyst Agent. """
     
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, streaming: bool = False):
+        """
+        Initialize the event queue.
+        
+        Args:
+            max_size: Maximum number of queued events
+            streaming: Also emit a tool_input event before each tool runs, for UIs
+                that display tools while they are still executing
+        """
         self.queue = queue.Queue(maxsize=max_size)
+        self.streaming = streaming
         
     def add_tool_input(self, tool_name: str, tool_args: Dict[str, Any], 
                        metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -97,6 +107,25 @@ class EventQueue:
         self.queue.put(event)
         return event.id
     
+    def add_tool_invocation(self, tool_name: str, tool_args: Dict[str, Any], 
+                            success: bool, data: Any = None,
+                            error: Optional[str] = None,
+                            metadata: Optional[Dict[str, Any]] = None) -> str:
+        """ Record a complete tool call (input and output) as a single event. """
+        event = Event(
+            event_type=EventType.TOOL_INVOCATION,
+            data={
+                "tool_name": tool_name,
+                "tool_args": tool_args,
+                "success": success,
+                "data": data,
+                "error": error
+            },
+            metadata=metadata
+        )
+        self.queue.put(event)
+        return event.id
+    
     def add_planning(self, 
                     goal: str,
                     plan: Dict[str, Any],
@@ -20,9 +20,10 @@ from .utils import setup_logger
 
 from .config import AgentConfig
 from .utils import setup_logger
-from catalyst_agent.utils.prompt_templates import SYSTEM_GENERATE, SYSTEM_REPLAN 
-from catalyst_agent.utils.prompt_templates import USER_PLAN, TOOLS_FEW_SHOT_EXAMPLES
-from catalyst_agent.utils.prompt_templates import USER_GENERATE, USER_REPLAN
+from catalyst_agent.utils.prompt_templates import render_system_generate, render_system_replan
+from catalyst_agent.utils.prompt_templates import render_user_plan
+from catalyst_agent.utils.prompt_templates import render_user_generate, render_user_replan
+from catalyst_agent.utils.prompt_templates import SYSTEM_SUMMARIZE_HISTORY
 
 from .event_queue import EventQueue, EventType
 
@@ -51,6 +52,9 @@ class LLMManager:
         
         # Initialize event queue
         self.event_queue = event_queue or EventQueue()
+        
+        # (tool identities, tools, rendered text) of the last formatted tool set
+        self._tool_descriptions_cache = None
 
         # Initialize the LLM client (dependency injection or based on config)
         if llm_client:
@@ -103,7 +107,17 @@ class LLMManager:
         
         return current_date
     def _format_tool_descriptions(self, tools: List[Any]) -> str:
-        """ Formats tool descriptions including parameters for the LLM prompt. """
+        """
+        Formats tool descriptions including parameters for the LLM prompt.
+        
+        The tool set is fixed once tools are registered, so the text rendered for the
+        last set of tool instances is reused (which also keeps the prompt byte-identical).
+        """
+        key = tuple(map(id, tools))
+        cached = self._tool_descriptions_cache
+        if cached is not None and cached[0] == key:
+            return cached[2]
+        
         tool_details = []
         for tool in tools:
             schema = tool.get_schema() if hasattr(tool, 'get_schema') else {}
@@ -127,7 +141,10 @@ class LLMManager:
                 
             tool_details.append(tool_detail)
         
-        return "\n".join(tool_details)
+        text = "\n".join(tool_details)
+        # Keep references to the tools so their ids can't be reused while cached
+        self._tool_descriptions_cache = (key, list(tools), text)
+        return text
 
     
     def generate_plan(self, goal: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -150,21 +167,20 @@ class LLMManager:
         conversation_history = context.get('conversation_history', '')
         
         # Construct prompt for the LLM
-        system_message = SYSTEM_GENERATE.format(
+        system_message = render_system_generate(
                                 current_date=current_date, 
                                 storage_path=self.config.blob_storage_path)
 
         # Log the full system message for debugging
-        self.logger.info(f"System message for planning: {system_message}")
+        self.logger.info("System message for planning: %s", system_message)
 
-        user_message = USER_PLAN.format(
+        user_message = render_user_plan(
             goal=goal,
             tool_descriptions=tool_descriptions,
-            conversation_history=conversation_history,
-            few_shot_examples=TOOLS_FEW_SHOT_EXAMPLES
+            conversation_history=conversation_history
         )
 
-        self.logger.info(f"User message for planning: {user_message}")
+        self.logger.info("User message for planning: %s", user_message)
         
         # Generate a plan using the LLM
         self.logger.info(f"Generating plan for goal: {goal}")
@@ -273,9 +289,9 @@ class LLMManager:
             self.logger.info("Added temporal context to response system message")
         
         # Log the full system message for debugging
-        self.logger.debug(f"System message for response: {system_message}")
+        self.logger.debug("System message for response: %s", system_message)
 
-        user_message = USER_GENERATE.format(
+        user_message = render_user_generate(
             message=message,
             conversation_history=conversation_history
         )
@@ -333,6 +349,30 @@ class LLMManager:
             self.logger.error(f"Error generating response: {str(e)}")
             return f"I apologize, but I encountered an error while processing your request: {str(e)}"
     
+    def summarize_history(self, history_text: str) -> str:
+        """
+        Summarize older conversation turns so they take fewer prompt tokens.
+
+        Args:
+            history_text: The conversation turns to summarize
+
+        Returns:
+            Summary text, or an empty string if summarization failed
+        """
+        try:
+            response_dict = self.llm_client.chat_completion(
+                messages=[
+                    {"role": "system", "content": SYSTEM_SUMMARIZE_HISTORY},
+                    {"role": "user", "content": history_text}
+                ],
+                temperature=0.0,
+                max_tokens=512
+            )
+            return response_dict['choices'][0]['message']['content'].strip()
+        except Exception as e:
+            self.logger.error(f"Error summarizing conversation history: {str(e)}")
+            return ""
+
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in a text using the configured LLM client.
@@ -388,13 +428,15 @@ class LLMManager:
         self.logger.info(f"blob_storage_path: {self.config.blob_storage_path}")
 
         # Construct prompt for the LLM
-        system_message = SYSTEM_REPLAN.format(
+        system_message = render_system_replan(
                                 current_date=current_date, 
                                 storage_path=self.config.blob_storage_path)
              
-        self.logger.info(f"current_plan: {json.dumps(current_plan, indent=2)}")
+        # Serializing the whole plan is expensive, only do it when it will be logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("current_plan: %s", json.dumps(current_plan, indent=2))
 
-        user_message = USER_REPLAN.format(
+        user_message = render_user_replan(
             goal=goal,
             tool_descriptions=tool_descriptions,
             executed_steps_str=executed_steps_str,
@@ -405,7 +447,7 @@ class LLMManager:
         
         # Generate an updated plan using the LLM
         self.logger.info(f"Reevaluating plan for goal: {goal} after step execution")
-        self.logger.info(f"user_message: {user_message}")
+        self.logger.info("user_message: %s", user_message)
         
         try:
             response_dict = self.llm_client.chat_completion(
@@ -420,7 +462,7 @@ class LLMManager:
             
             # Extract and parse the response
             content = response_dict['choices'][0]['message']['content']
-            self.logger.info(f"Received plan reevaluation response: {content}")
+            self.logger.info("Received plan reevaluation response: %s", content)
             
             try:
                 reevaluation_data = json.loads(content)
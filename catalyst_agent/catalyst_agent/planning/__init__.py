@@ -11,11 +11,15 @@ from .base import PlanStatus, PlanStep, Plan
 # Import engine components
 from .engine import Planner, Executor, PlanningEngine
 
+# Import plan caching
+from .cache import PlanCache
+
 __all__ = [
     'PlanStatus',
     'PlanStep',
     'Plan',
     'Planner',
     'Executor',
-    'PlanningEngine'
+    'PlanningEngine',
+    'PlanCache'
 ]
\ No newline at end of file
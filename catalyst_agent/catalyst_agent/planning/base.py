@@ -6,7 +6,8 @@ steps, and complete plans.
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import sys
 import uuid
 
 
@@ -19,6 +20,10 @@ class PlanStatus(Enum):
     BLOCKED = "blocked"
 
 
+# Values the LLM uses to mean "no tool" / "no arguments"
+_NULL_VALUES = (None, "", "null", "None")
+
+
 class PlanStep:
     """A single step in an execution plan."""
     
@@ -27,7 +32,12 @@ class PlanStep:
         description: str, 
         tool_name: Optional[str] = None,
         tool_args: Optional[Dict[str, Any]] = None,
-        depends_on: Optional[List[str]] = None
+        depends_on: Optional[List[str]] = None,
+        id: Optional[str] = None,
+        status: PlanStatus = PlanStatus.PENDING,
+        result: Any = None,
+        error: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize a plan step.
@@ -37,16 +47,37 @@ class PlanStep:
             tool_name: Name of the tool to use for this step (if applicable)
             tool_args: Arguments to pass to the tool (if applicable)
             depends_on: IDs of steps that must be completed before this one
+            id: Existing step ID (a new one is generated if omitted)
+            status: Initial status of the step
+            result: Result of a previous execution (if any)
+            error: Error of a previous execution (if any)
+            metadata: Additional step metadata
         """
-        self.id = str(uuid.uuid4())
+        self.id = id or str(uuid.uuid4())
         self.description = description
         self.tool_name = tool_name
         self.tool_args = tool_args or {}
         self.depends_on = depends_on or []
-        self.status = PlanStatus.PENDING
-        self.result = None
-        self.error = None
-        self.metadata: Dict[str, Any] = {}
+        self.status = status
+        self.result = result
+        self.error = error
+        self.metadata: Dict[str, Any] = metadata if metadata is not None else {}
+        self._desc_lower: Optional[str] = None
+        self._desc_lower_src: Optional[str] = None
+    
+    @property
+    def desc_lower(self) -> str:
+        """Lowercased, interned description, computed once per description value."""
+        if self._desc_lower_src is not self.description:
+            self._desc_lower = sys.intern(self.description.lower())
+            self._desc_lower_src = self.description
+        return self._desc_lower
+    
+    @property
+    def signature(self) -> Tuple[str, Optional[str]]:
+        """Key used to detect duplicate steps: (lowercased description, tool name)."""
+        tool_name = sys.intern(self.tool_name) if self.tool_name else self.tool_name
+        return (self.desc_lower, tool_name)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the plan step to a dictionary."""
@@ -63,20 +94,58 @@ class PlanStep:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PlanStep':
-        """Create a plan step from a dictionary."""
-        step = cls(
-            description=data["description"],
-            tool_name=data.get("tool_name"),
-            tool_args=data.get("tool_args", {}),
-            depends_on=data.get("depends_on", [])
+    def from_dict(cls, data: Dict[str, Any], as_new: bool = False) -> 'PlanStep':
+        """
+        Create a plan step from a dictionary.
+        
+        Also accepts the loosely structured step dictionaries produced by the
+        LLM: 'task' is accepted for 'description', 'parameters'/'arguments' for
+        'tool_args', and null-like tool names or arguments are normalized.
+        
+        Args:
+            data: Dictionary describing the step
+            as_new: Ignore any id, dependencies, status, result and error in
+                the data and create a fresh pending step
+            
+        Returns:
+            The created plan step
+            
+        Raises:
+            ValueError: If the data is not a dictionary or has an invalid status
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid plan step data: {data!r}")
+        
+        description = data.get("description") or data.get("task") or "Unknown step"
+        
+        tool_name = data.get("tool_name")
+        if tool_name in _NULL_VALUES:
+            tool_name = None
+        
+        tool_args = data.get("tool_args")
+        if tool_args is None:
+            tool_args = data.get("parameters", data.get("arguments"))
+        if tool_args in _NULL_VALUES:
+            tool_args = {}
+        
+        if as_new:
+            return cls(
+                description=description,
+                tool_name=tool_name,
+                tool_args=tool_args
+            )
+        
+        return cls(
+            description=description,
+            tool_name=tool_name,
+            tool_args=tool_args,
+            depends_on=data.get("depends_on") or [],
+            id=data.get("id"),
+            status=PlanStatus(data.get("status", PlanStatus.PENDING.value)),
+            result=data.get("result"),
+            error=data.get("error"),
+            metadata=data.get("metadata") or {}
         )
-        step.id = data["id"]
-        step.status = PlanStatus(data["status"])
-        step.result = data.get("result")
-        step.error = data.get("error")
-        step.metadata = data.get("metadata", {})
-        return step
     
     def __str__(self) -> str:
         """String representation of the plan step."""
@@ -0,0 +1,232 @@
+"""
+Plan caching for the Agentic Core.
+
+This module provides the PlanCache class, which stores the structure of
+successfully completed plans so that repeated goals can skip the LLM
+planning call entirely.
+"""
+
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any, Sequence
+from catalyst_agent.utils import load_json_file, save_json_file
+from .base import Plan, PlanStep
+
+
+class PlanCache:
+    """
+    LRU cache of successful plan templates keyed by goal and context.
+
+    Only the structure of a plan (step descriptions, tools, arguments and
+    dependencies) is stored. Every lookup returns a fresh Plan with new ids
+    and pending steps, so cached templates are never mutated by execution.
+
+    If an embedding function is given, a goal that misses the exact lookup can
+    still reuse the plan of a paraphrased goal: the cached entry with the most
+    similar goal embedding (same tool set, cosine similarity at or above the
+    threshold) is returned.
+
+    If a storage path is given, the cache is loaded from and saved to that
+    JSON file, so plans are reused across agent restarts.
+    """
+
+    def __init__(self, max_size: int = 128,
+                 embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+                 similarity_threshold: float = 0.93,
+                 storage_path: Optional[str] = None):
+        """
+        Initialize the plan cache.
+
+        Args:
+            max_size: Maximum number of plan templates to keep
+            embed_fn: Function returning an embedding vector for a goal, enabling
+                      lookups by semantic similarity (optional)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            storage_path: JSON file the cache is persisted to (optional)
+        """
+        self.max_size = max_size
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.storage_path = storage_path
+        if storage_path and os.path.exists(storage_path):
+            self._load()
+
+    @staticmethod
+    def normalize_goal(goal: str) -> str:
+        """Normalize a goal so trivial whitespace/case differences share a key."""
+        return " ".join(goal.lower().split())
+
+    @staticmethod
+    def context_fingerprint(context: Optional[Dict[str, Any]]) -> str:
+        """
+        Build a deterministic fingerprint of the planning-relevant context.
+
+        A cached plan is only valid if the same tools are available, so the
+        fingerprint is the sorted list of available tool names.
+
+        Args:
+            context: Planning context
+
+        Returns:
+            Fingerprint string
+        """
+        if not context:
+            return ""
+        tools = context.get('available_tools') or []
+        names = sorted(getattr(tool, 'name', str(tool)) for tool in tools)
+        return ",".join(names)
+
+    def make_key(self, goal: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the cache key for a goal and context.
+
+        Args:
+            goal: The goal to plan for
+            context: Planning context
+
+        Returns:
+            Hex digest identifying the goal/context pair
+        """
+        raw = self.normalize_goal(goal) + "\x00" + self.context_fingerprint(context)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, goal: str, context: Optional[Dict[str, Any]] = None) -> Optional[Plan]:
+        """
+        Look up a cached plan for the given goal.
+
+        Args:
+            goal: The goal to plan for
+            context: Planning context
+
+        Returns:
+            A fresh Plan built from the cached template, or None on a miss
+        """
+        key = self.make_key(goal, context)
+        entry = self._entries.get(key)
+        if entry is None and self.embed_fn is not None:
+            key, entry = self._find_similar(goal, context)
+            if entry is not None:
+                self.semantic_hits += 1
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._build_plan(goal, entry)
+
+    def put(self, plan: Plan, context: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store the structure of a plan in the cache.
+
+        Args:
+            plan: The (successfully completed) plan to store
+            context: Planning context the plan was created with
+        """
+        if not plan.steps:
+            return
+
+        key = self.make_key(plan.goal, context)
+        template = self._make_template(plan)
+        if self.embed_fn is not None:
+            template["fingerprint"] = self.context_fingerprint(context)
+            template["embedding"] = self._embed(plan.goal)
+        self._entries[key] = template
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._save()
+
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        self._entries.clear()
+        self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        """Load persisted plan templates (oldest first) from the storage file."""
+        data = load_json_file(self.storage_path)
+        for key, template in (data.get("entries") or {}).items():
+            self._entries[key] = template
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        """Persist the plan templates, in LRU order, to the storage file."""
+        if self.storage_path:
+            save_json_file({"version": 1, "entries": self._entries}, self.storage_path, durable=False)
+
+    def _embed(self, goal: str) -> List[float]:
+        """Embed a normalized goal as a unit vector, so cosine similarity is a dot product."""
+        vector = [float(x) for x in self.embed_fn(self.normalize_goal(goal))]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    def _find_similar(self, goal: str, context: Optional[Dict[str, Any]]):
+        """
+        Find the cached entry whose goal is most similar to the given one.
+
+        Args:
+            goal: The goal to plan for
+            context: Planning context (only entries for the same tool set match)
+
+        Returns:
+            (key, entry) of the best match, or (None, None) if none reaches the threshold
+        """
+        fingerprint = self.context_fingerprint(context)
+        embedding = self._embed(goal)
+        best_key, best_entry, best_score = None, None, self.similarity_threshold
+        for key, entry in self._entries.items():
+            cached = entry.get("embedding")
+            if cached is None or entry.get("fingerprint") != fingerprint or len(cached) != len(embedding):
+                continue
+            score = sum(a * b for a, b in zip(embedding, cached))
+            if score >= best_score:
+                best_key, best_entry, best_score = key, entry, score
+        return best_key, best_entry
+
+    @staticmethod
+    def _make_template(plan: Plan) -> Dict[str, Any]:
+        """Extract the reusable structure of a plan."""
+        index_by_id = {step.id: i for i, step in enumerate(plan.steps)}
+        steps: List[Dict[str, Any]] = []
+        for step in plan.steps:
+            steps.append({
+                "description": step.description,
+                "tool_name": step.tool_name,
+                "tool_args": dict(step.tool_args),
+                # Dependencies are stored by position since step ids are regenerated
+                "depends_on": [index_by_id[dep] for dep in step.depends_on if dep in index_by_id]
+            })
+
+        metadata = {}
+        if 'reasoning' in plan.metadata:
+            metadata['reasoning'] = plan.metadata['reasoning']
+
+        return {"steps": steps, "metadata": metadata}
+
+    @staticmethod
+    def _build_plan(goal: str, template: Dict[str, Any]) -> Plan:
+        """Create a new pending Plan from a cached template."""
+        plan = Plan(goal=goal)
+        for step_data in template["steps"]:
+            plan.add_step(PlanStep(
+                description=step_data["description"],
+                tool_name=step_data["tool_name"],
+                tool_args=dict(step_data["tool_args"])
+            ))
+
+        for step, step_data in zip(plan.steps, template["steps"]):
+            step.depends_on = [plan.steps[i].id for i in step_data["depends_on"]]
+
+        plan.metadata.update(template["metadata"])
+        plan.metadata['from_cache'] = True
+        return plan
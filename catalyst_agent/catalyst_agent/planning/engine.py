@@ -5,11 +5,14 @@ This module provides the PlanningEngine class and abstractions for planners
 and executors that create and run plans.
 """
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from catalyst_agent.utils import setup_logger
 from .base import Plan, PlanStep, PlanStatus
-from catalyst_agent.utils import setup_logger
+from .cache import PlanCache
 
 class Planner(ABC):
     """Abstract base class for planners that create execution plans."""
@@ -55,7 +58,15 @@ class PlanningEngine:
     tracking progress and handling failures.
     """
     
-    def __init__(self, planner: Planner, executor: Executor, llm_manager=None):
+    def __init__(
+        self, 
+        planner: Planner, 
+        executor: Executor, 
+        llm_manager=None,
+        plan_cache: Optional[PlanCache] = None,
+        reeval_cache_size: int = 256,
+        reeval_every_n: int = 1
+    ):
         """
         Initialize the planning engine.
         
@@ -63,13 +74,28 @@ class PlanningEngine:
             planner: The planner to use for creating plans
             executor: The executor to use for executing plan steps
             llm_manager: LLMManager instance for plan reevaluation (optional)
+            plan_cache: Cache of successful plans used to skip planning for repeated goals (optional)
+            reeval_cache_size: Maximum number of memoized plan reevaluations (0 disables memoization)
+            reeval_every_n: Reevaluate the plan after every N successful steps; steps that
+                recovered from an error or produced no result are always reevaluated
         """
         self.planner = planner
         self.executor = executor
         self.llm_manager = llm_manager
         self.current_plan: Optional[Plan] = None
         self.execution_context: Dict[str, Any] = {}
-        self.executed_steps: List[Dict[str, Any]] = []
+        self.executed_steps: List[PlanStep] = []
+        # (lowercased description, tool name) of every executed step, for O(1) duplicate checks
+        self._executed_signatures: Set[Tuple[str, Optional[str]]] = set()
+        self.plan_cache = plan_cache
+        self.reeval_cache_size = reeval_cache_size
+        self._reeval_cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self.reeval_every_n = max(1, reeval_every_n)
+        self._steps_since_reeval = 0
+        # Observers notified with the plan after create_plan, and with the plan and
+        # its outcome after execute_plan (e.g. for debugging or tracing)
+        self.plan_created_callbacks: List[Callable[[Plan], None]] = []
+        self.plan_executed_callbacks: List[Callable[[Plan, bool], None]] = []
         self.logger = setup_logger('agentic.planning')
     
     def create_plan(self, goal: str, context: Dict[str, Any]) -> Plan:
@@ -84,9 +110,17 @@ class PlanningEngine:
             The created plan
         """
         self.logger.info(f"Creating plan for goal: {goal}")
-        self.current_plan = self.planner.create_plan(goal, context)
-        self.logger.info(f"Plan created: {self.current_plan}")
+        
+        cached_plan = self.plan_cache.get(goal, context) if self.plan_cache is not None else None
+        if cached_plan:
+            self.logger.info("Reusing cached plan for goal")
+            self.current_plan = cached_plan
+        else:
+            self.current_plan = self.planner.create_plan(goal, context)
+        self.logger.info("Plan created: %s", self.current_plan)
         self.execution_context = dict(context)  # Create a copy
+        for callback in self.plan_created_callbacks:
+            callback(self.current_plan)
         return self.current_plan
     
     def execute_plan(
@@ -108,6 +142,8 @@ class PlanningEngine:
             self.current_plan = plan
             # Reset executed steps when starting a new plan
             self.executed_steps = []
+            self._executed_signatures = set()
+            self._steps_since_reeval = 0
         
         if not self.current_plan:
             raise ValueError("No plan to execute")
@@ -124,6 +160,8 @@ class PlanningEngine:
                 
             # If the step failed, return False
             if step.status == PlanStatus.FAILED:
+                for callback in self.plan_executed_callbacks:
+                    callback(self.current_plan, False)
                 return False
                 
             # Call the step callback if provided
@@ -131,7 +169,12 @@ class PlanningEngine:
                 step_callback(step)
         
         # Check if plan is completed
-        return self.current_plan.status == PlanStatus.COMPLETED
+        completed = self.current_plan.status == PlanStatus.COMPLETED
+        if completed and self.plan_cache is not None:
+            self.plan_cache.put(self.current_plan, self.execution_context)
+        for callback in self.plan_executed_callbacks:
+            callback(self.current_plan, completed)
+        return completed
     
     def execute_next_step(self) -> Optional[PlanStep]:
         """
@@ -152,20 +195,13 @@ class PlanningEngine:
         
         # Check if this step is a duplicate of a previous step
         # This helps prevent infinite loops with identical steps
-        is_duplicate = False
-        for executed_step in self.executed_steps:
-            if (executed_step.get('description', '').lower() == step.description.lower() and
-                executed_step.get('tool_name') == step.tool_name):
-                is_duplicate = True
-                self.logger.warning(f"Detected duplicate step: {step.description}. Skipping execution.")
-                break
-        
-        if is_duplicate:
+        if step.signature in self._executed_signatures:
+            self.logger.warning(f"Detected duplicate step: {step.description}. Skipping execution.")
+            
             # Mark the duplicate step as completed and return it
             step.status = PlanStatus.COMPLETED
             step.result = "Step skipped to avoid duplication of previous step"
-            step_dict = step.to_dict()
-            self.executed_steps.append(step_dict)
+            self._record_executed_step(step)
             
             # Update the overall plan status
             self.current_plan.update_status()
@@ -179,106 +215,9 @@ class PlanningEngine:
             step.status = PlanStatus.COMPLETED
             
             # Store the executed step for plan reevaluation
-            step_dict = step.to_dict()
-            self.executed_steps.append(step_dict)
-            
-            # Reevaluate the plan if LLM manager is available
-            if self.llm_manager and hasattr(self.llm_manager, 'reevaluate_plan'):
-                current_plan_dict = self.current_plan.to_dict()
-                
-                # Add the current_goal to the context
-                self.execution_context['current_goal'] = self.current_plan.goal
-                
-                # Ensure executed_steps is a list of dictionaries that can be properly processed
-                # This fixes the 'self' reference error by ensuring we're passing compatible data types
-                safe_executed_steps = []
-                for executed_step in self.executed_steps:
-                    # Make sure we're working with a plain dictionary
-                    if isinstance(executed_step, dict):
-                        safe_executed_steps.append(executed_step)
-                    elif hasattr(executed_step, 'to_dict'):
-                        # If it's an object with a to_dict method, use that
-                        safe_executed_steps.append(executed_step.to_dict())
-                    else:
-                        # Last resort, create a simple dict representation
-                        safe_executed_steps.append({
-                            'description': str(executed_step),
-                            'tool_name': None,
-                            'tool_args': {}
-                        })
-                
-                # Reevaluate the plan based on the execution results
-                updated_plan_dict = self.llm_manager.reevaluate_plan(
-                    goal=self.current_plan.goal,
-                    current_plan=current_plan_dict,
-                    executed_steps=safe_executed_steps,
-                    last_step_result=step.result,
-                    context=self.execution_context
-                )
-                
-                # Check if the plan was modified and needs to be updated
-                if updated_plan_dict != current_plan_dict:
-                    # Create a new plan from the updated plan dictionary
-                    remaining_steps = []
-                    
-                    # Get the updated steps (skip already executed steps)
-                    updated_steps = updated_plan_dict.get('plan', [])[len(self.executed_steps):]
-                    
-                    # Check if the remaining steps would cause an infinite loop
-                    # Look for steps that are too similar to previously executed steps
-                    safe_steps = []
-                    for updated_step_data in updated_steps:
-                        updated_description = updated_step_data.get('description', '').lower()
-                        # Check if this step is too similar to a previously executed step
-                        is_similar_to_previous = False
-                        for executed_step in self.executed_steps:
-                            executed_description = executed_step.get('description', '').lower()
-                            # If descriptions are very similar (80% or more word overlap)
-                            # and it's not a tool-based step, consider it a duplicate
-                            words1 = set(executed_description.split())
-                            words2 = set(updated_description.split())
-                            if words1 and words2:  # Avoid division by zero
-                                overlap = len(words1.intersection(words2)) / min(len(words1), len(words2))
-                                if overlap > 0.8 and not updated_step_data.get('tool_name'):
-                                    is_similar_to_previous = True
-                                    self.logger.warning(f"Detected similar step: {updated_description}. Skipping.")
-                                    break
-                        
-                        if not is_similar_to_previous:
-                            safe_steps.append(updated_step_data)
-                    
-                    # Only use the safe steps that don't cause loops
-                    for updated_step_data in safe_steps:
-                        description = updated_step_data.get('description', 'Unknown step')
-                        tool_name = updated_step_data.get('tool_name')
-                        tool_args = updated_step_data.get('tool_args', {})
-                        
-                        # Skip None or empty tool names/args
-                        if tool_name in [None, "", "null", "None"]:
-                            tool_name = None
-                        
-                        if tool_args in [None, "null", "None"]:
-                            tool_args = {}
-                        
-                        # Create a new plan step
-                        new_step = PlanStep(
-                            description=description,
-                            tool_name=tool_name,
-                            tool_args=tool_args
-                        )
-                        remaining_steps.append(new_step)
-                    
-                    # Update the current plan with new steps (replacing all pending steps)
-                    completed_steps = [s for s in self.current_plan.steps if s.status == PlanStatus.COMPLETED]
-                    self.current_plan.steps = completed_steps + remaining_steps
-                    
-                    # Update the reasoning in metadata
-                    self.current_plan.metadata['reevaluation_reasoning'] = updated_plan_dict.get('reasoning', 'Plan was reevaluated')
-                    
-                    # If updated plan has no steps, mark the plan as completed
-                    if not remaining_steps:
-                        self.logger.info("No more steps in updated plan, marking plan as completed")
-                        self.current_plan.status = PlanStatus.COMPLETED
+            self._record_executed_step(step)
+            self._steps_since_reeval += 1
+            self._maybe_reevaluate(step)
         else:
             step.status = PlanStatus.FAILED
             self.current_plan.status = PlanStatus.FAILED
@@ -288,6 +227,185 @@ class PlanningEngine:
         
         return step
     
+    def _maybe_reevaluate(self, step: PlanStep) -> None:
+        """
+        Reevaluate the plan after a successful step if something worth replanning for happened.
+        
+        Args:
+            step: The step that was just completed
+        """
+        # Reevaluate the plan if LLM manager is available and something worth replanning for happened
+        if not (self.llm_manager and hasattr(self.llm_manager, 'reevaluate_plan')
+                and self._should_reevaluate(step)):
+            return
+        
+        self._steps_since_reeval = 0
+        current_plan_dict = self.current_plan.to_dict()
+        
+        # Add the current_goal to the context
+        self.execution_context['current_goal'] = self.current_plan.goal
+        
+        # Executed steps are only serialized here, for the LLM
+        executed_steps_dicts = [s.to_dict() for s in self.executed_steps]
+        
+        # Reevaluate the plan based on the execution results, reusing a
+        # previous answer when the same plan reached the same state before
+        updated_plan_dict = self._reevaluate_plan(current_plan_dict, executed_steps_dicts, step.result)
+        
+        # Check if the plan was modified and needs to be updated
+        if updated_plan_dict is not None:
+            # Create new steps from the updated plan, skipping already executed steps
+            remaining_steps = []
+            for updated_step_data in updated_plan_dict.get('plan', [])[len(self.executed_steps):]:
+                try:
+                    new_step = PlanStep.from_dict(updated_step_data, as_new=True)
+                except ValueError as e:
+                    self.logger.warning(f"Ignoring malformed step in updated plan: {e}")
+                    continue
+                
+                # Skip steps that are too similar to a previously executed step to avoid loops
+                if not new_step.tool_name and self._is_similar_to_executed(new_step):
+                    self.logger.warning(f"Detected similar step: {new_step.desc_lower}. Skipping.")
+                    continue
+                
+                remaining_steps.append(new_step)
+            
+            # Update the current plan with new steps (replacing all pending steps)
+            completed_steps = [s for s in self.current_plan.steps if s.status == PlanStatus.COMPLETED]
+            self.current_plan.steps = completed_steps + remaining_steps
+            
+            # Update the reasoning in metadata
+            self.current_plan.metadata['reevaluation_reasoning'] = updated_plan_dict.get('reasoning', 'Plan was reevaluated')
+            
+            # If updated plan has no steps, mark the plan as completed
+            if not remaining_steps:
+                self.logger.info("No more steps in updated plan, marking plan as completed")
+                self.current_plan.status = PlanStatus.COMPLETED
+    
+    def _is_similar_to_executed(self, step: PlanStep) -> bool:
+        """
+        Check whether a step's description overlaps 80% or more with an executed step.
+        
+        Args:
+            step: The candidate step
+            
+        Returns:
+            True if a previously executed step has a very similar description
+        """
+        words2 = set(step.desc_lower.split())
+        if not words2:
+            return False
+        
+        for executed_step in self.executed_steps:
+            words1 = set(executed_step.desc_lower.split())
+            if words1:  # Avoid division by zero
+                overlap = len(words1.intersection(words2)) / min(len(words1), len(words2))
+                if overlap > 0.8:
+                    return True
+        return False
+    
+    def _record_executed_step(self, step: PlanStep) -> None:
+        """Remember a step as executed for duplicate detection and reevaluation."""
+        self.executed_steps.append(step)
+        self._executed_signatures.add(step.signature)
+    
+    def _should_reevaluate(self, step: PlanStep) -> bool:
+        """
+        Decide whether the plan needs to be reevaluated after a successful step.
+        
+        Args:
+            step: The step that was just completed
+            
+        Returns:
+            True if the LLM should be asked to reevaluate the plan
+        """
+        if self._steps_since_reeval >= self.reeval_every_n:
+            return True
+        
+        # The step only succeeded after an error was handled, so the plan may be stale
+        if step.metadata.get('recovered') or step.error:
+            return True
+        
+        # A tool step that produced nothing is not what the plan expected
+        if step.tool_name and step.result in (None, "", [], {}):
+            return True
+        
+        # Give the LLM a chance to extend the plan before it completes
+        return self.current_plan.get_next_executable_step() is None
+    
+    def _reevaluate_plan(
+        self, 
+        current_plan_dict: Dict[str, Any], 
+        executed_steps: List[Dict[str, Any]], 
+        last_step_result: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Reevaluate the current plan, memoizing the LLM's answer.
+        
+        Args:
+            current_plan_dict: Dictionary form of the current plan
+            executed_steps: Steps executed so far
+            last_step_result: Result of the most recently executed step
+            
+        Returns:
+            The updated plan dictionary, or None if the plan was left unchanged
+        """
+        key = None
+        if self.reeval_cache_size > 0:
+            key = self._reeval_key(current_plan_dict, executed_steps, last_step_result)
+            if key in self._reeval_cache:
+                self._reeval_cache.move_to_end(key)
+                self.logger.info("Reusing memoized plan reevaluation")
+                return self._reeval_cache[key]
+        
+        updated_plan_dict = self.llm_manager.reevaluate_plan(
+            goal=self.current_plan.goal,
+            current_plan=current_plan_dict,
+            executed_steps=executed_steps,
+            last_step_result=last_step_result,
+            context=self.execution_context
+        )
+        if updated_plan_dict == current_plan_dict:
+            updated_plan_dict = None
+        
+        if key is not None:
+            self._reeval_cache[key] = updated_plan_dict
+            while len(self._reeval_cache) > self.reeval_cache_size:
+                self._reeval_cache.popitem(last=False)
+        
+        return updated_plan_dict
+    
+    @staticmethod
+    def _reeval_key(
+        current_plan_dict: Dict[str, Any], 
+        executed_steps: List[Dict[str, Any]], 
+        last_step_result: Any
+    ) -> str:
+        """
+        Build a memoization key for a plan reevaluation.
+        
+        Step ids are generated per run, so steps are fingerprinted by their
+        structure (description, tool and arguments) to allow hits across runs.
+        """
+        def fingerprint(steps):
+            return [
+                (s.get('description'), s.get('tool_name'), s.get('tool_args'))
+                for s in steps
+            ]
+        
+        payload = json.dumps(
+            [
+                current_plan_dict.get('goal'),
+                fingerprint(current_plan_dict.get('steps', [])),
+                fingerprint(executed_steps),
+                # Digest of the whole result, so long results that only differ late don't collide
+                hashlib.sha256(str(last_step_result).encode('utf-8')).hexdigest()
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
     def get_plan_status(self) -> Optional[PlanStatus]:
         """Get the status of the current plan."""
         if not self.current_plan:
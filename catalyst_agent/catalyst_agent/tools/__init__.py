@@ -5,21 +5,35 @@ This module provides abstractions for discovering, registering, and using
 tools that extend the agent's capabilities.
 """
 
+import importlib
+
 # Import core classes from base module
 from .base import Tool, ToolResult, FunctionTool, ToolRegistry
 
-# Import specialized tools
-from .code_execution import DynamicCodeExecutionTool
-from .image_generation import ImageGenerationTool
-from .web_search import WebSearchTool
-from .web_fetch import WebFetchTool
-from .package_manager import PackageInstallerTool
-from .download_file import DownloadFileTool
-from .image_search import ImageSearchTool
-
 # Import discovery utilities
 from .discovery import discover_tools, instantiate_tool
 
+# Specialized tools are imported on first access (see __getattr__), so importing
+# the package doesn't load requests, bs4, etc. for tools that are never used
+_LAZY_TOOLS = {
+    'DynamicCodeExecutionTool': '.code_execution',
+    'ImageGenerationTool': '.image_generation',
+    'WebSearchTool': '.web_search',
+    'WebFetchTool': '.web_fetch',
+    'PackageInstallerTool': '.package_manager',
+    'DownloadFileTool': '.download_file',
+    'ImageSearchTool': '.image_search',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = tool_class
+    return tool_class
+
 __all__ = [
     'Tool', 
     'ToolResult', 
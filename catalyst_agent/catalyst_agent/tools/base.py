@@ -7,6 +7,8 @@ that extend the agent's capabilities.
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Callable
+import asyncio
+import functools
 import inspect
 import uuid
 from catalyst_agent.event_queue import EventQueue
@@ -80,6 +82,25 @@ class Tool(ABC):
         """
         pass
     
+    async def aexecute(self, **kwargs) -> ToolResult:
+        """
+        Execute the tool without blocking the running event loop.
+        
+        The default implementation runs ``execute`` in a worker thread, so
+        blocking network and disk I/O (e.g. image downloads) overlaps with
+        other coroutines. Tools with a native async implementation can
+        override this.
+        
+        Args:
+            **kwargs: Tool-specific arguments
+            
+        Returns:
+            Result of the tool execution
+        """
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.execute, **kwargs))
+    
     @abstractmethod
     def get_schema(self) -> Dict[str, Any]:
         """
@@ -189,6 +210,55 @@ class FunctionTool(Tool):
         }
 
 
+def _compile_arg_validator(tool: Tool) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Build an argument check for a tool from its parameter schema.
+    
+    The schema and the signature of ``execute`` are inspected once, when the tool
+    is registered, so each call only does a couple of set operations. Only
+    arguments ``execute`` itself requires (no default) are reported as missing,
+    so calls that worked before aren't rejected because of a stricter schema.
+    
+    Args:
+        tool: The tool to build the check for
+        
+    Returns:
+        Function returning an error message for invalid arguments, or None if they are valid
+    """
+    try:
+        parameters = tool.get_schema().get("parameters") or {}
+    except Exception:
+        parameters = {}
+    
+    # Missing and unknown names are only rejected when execute() couldn't be called with them anyway
+    try:
+        signature = inspect.signature(tool.execute)
+        required = frozenset(
+            name for name, p in signature.parameters.items()
+            if p.default is inspect.Parameter.empty
+            and p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        )
+        accepts_any = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in signature.parameters.values())
+        known = frozenset(signature.parameters) | frozenset(parameters)
+    except (TypeError, ValueError):
+        required, accepts_any, known = frozenset(), True, frozenset()
+    valid_names = ", ".join(sorted(parameters)) or "none"
+    
+    def validate(kwargs: Dict[str, Any]) -> Optional[str]:
+        missing = required.difference(kwargs)
+        if missing:
+            return (f"Missing required parameter(s) for {tool.name}: {', '.join(sorted(missing))}. "
+                    f"Valid parameters: {valid_names}")
+        if not accepts_any:
+            unknown = set(kwargs).difference(known)
+            if unknown:
+                return (f"Unknown parameter(s) for {tool.name}: {', '.join(sorted(unknown))}. "
+                        f"Valid parameters: {valid_names}")
+        return None
+    
+    return validate
+
+
 class ToolRegistry:
     """
     Registry for tools available to the agent.
@@ -211,8 +281,16 @@ class ToolRegistry:
         """
         self._tools[tool.name] = tool
         
+        # Probe optional capabilities once so execute_tool doesn't have to on every call.
+        # Tools that gain capabilities later must be re-registered.
+        tool._has_pre = callable(getattr(tool, 'pre_execute', None))
+        tool._has_post = callable(getattr(tool, 'post_execute', None))
+        tool._has_err_handlers = callable(getattr(tool, 'get_error_handlers', None))
+        tool._event_metadata = {"tool_name": tool.name}
+        tool._validate_args = _compile_arg_validator(tool)
+        
         # If the tool has declared error handling capabilities, register those
-        if hasattr(tool, 'get_error_handlers') and callable(getattr(tool, 'get_error_handlers')):
+        if tool._has_err_handlers:
             error_handlers = tool.get_error_handlers()
             for error_pattern, handler_info in error_handlers.items():
                 self._error_handlers[error_pattern] = handler_info
@@ -254,30 +332,39 @@ class ToolRegistry:
             return ToolResult.error_result(f"Tool '{name}' not found")
         
         # Check if tool has pre-execution capabilities
-        if hasattr(tool, 'pre_execute') and callable(getattr(tool, 'pre_execute')):
+        if tool._has_pre:
             modified_kwargs = tool.pre_execute(**kwargs)
             if modified_kwargs is not None:
                 kwargs = modified_kwargs
         
-        tool.event_queue.add_tool_input(
-            tool_name=tool.name,
-            tool_args=kwargs,
-            metadata={"tool_name": tool.name}
-        )
+        # Reject arguments that don't match the tool's schema with a message the
+        # LLM can act on, instead of a TypeError from inside the tool
+        error = tool._validate_args(kwargs)
+        if error:
+            return ToolResult.error_result(error)
+        
+        event_queue = tool.event_queue
+        if event_queue.streaming:
+            event_queue.add_tool_input(
+                tool_name=tool.name,
+                tool_args=kwargs,
+                metadata=tool._event_metadata
+            )
 
         # Execute the tool
         result = tool.execute(**kwargs)
 
-        tool.event_queue.add_tool_output(
+        event_queue.add_tool_invocation(
             tool_name=tool.name,
+            tool_args=kwargs,
             success=result.success,
             data=result.data,
             error=result.error,
-            metadata={"tool_name": tool.name}
+            metadata=tool._event_metadata
         )
         
         # Check if tool has post-execution capabilities
-        if hasattr(tool, 'post_execute') and callable(getattr(tool, 'post_execute')):
+        if tool._has_post:
             modified_result = tool.post_execute(result, **kwargs)
             if modified_result is not None:
                 result = modified_result
@@ -296,7 +383,9 @@ class ToolRegistry:
         """
         if not error_message:
             return None
-            
+        
+        # Plain substring checks in registration order; for the handful of
+        # registered patterns this beats any combined regex
         for pattern, handler_info in self._error_handlers.items():
             if pattern in error_message:
                 return handler_info
@@ -7,19 +7,362 @@ in a controlled environment.
 
 import os
 import sys
+import re
+import builtins
+import ast
 import traceback
-from typing import Dict, List, Any, Optional, Union
-import uuid
-import tempfile
-import subprocess
-import json
+from typing import Dict, List, Any, Optional, Union, Tuple, FrozenSet
+from types import CodeType
+from collections.abc import Mapping
 import io
 import contextlib
+import functools
+import importlib
+import multiprocessing
+import pickle
+import queue
+import threading
+import atexit
+import signal
+import _thread
 from .base import Tool, ToolResult
 import logging
 from catalyst_agent.event_queue import EventQueue
 
 
+# Patterns that mark captured output as an error (case-insensitive, no lowercase copy needed)
+_ERROR_RE = re.compile(r'error|exception|traceback|failed', re.IGNORECASE)
+_STDOUT_ERROR_RE = re.compile(r'error:', re.IGNORECASE)
+
+
+def _validate_imports(tree: ast.AST, allowed: FrozenSet[str]) -> None:
+    """
+    Statically check that code only imports allowed top-level modules.
+    
+    Args:
+        tree: Parsed module to check
+        allowed: Names of the top-level modules that may be imported
+    
+    Raises:
+        PermissionError: If the code imports a module that is not allowed
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            if module.split('.')[0] not in allowed:
+                raise PermissionError(f"Import of module '{module}' is not allowed")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(code: str, allowed_imports: Optional[FrozenSet[str]] = None,
+                    return_last_expression: bool = False) -> Tuple[CodeType, bool]:
+    """
+    Prepare and compile agent code, memoized so repeated code skips parsing.
+    
+    A trailing ``return <expr>`` statement (and, if enabled, a trailing bare
+    expression) is rewritten into an assignment to ``__return_value__`` so
+    the value can be read back after ``exec``.
+    
+    Args:
+        code: The Python code to compile
+        allowed_imports: Top-level modules the code may import, or None to allow all
+        return_last_expression: Whether a trailing bare expression is also returned
+    
+    Returns:
+        Tuple of (compiled code object, whether the code ends with a return)
+    
+    Raises:
+        PermissionError: If the code imports a module that is not allowed
+    """
+    has_return = False
+    tree = ast.parse(code)
+    if allowed_imports is not None:
+        _validate_imports(tree, allowed_imports)
+    last = tree.body[-1] if tree.body else None
+    if isinstance(last, ast.Return) or (return_last_expression and isinstance(last, ast.Expr)):
+        has_return = True
+        # Replace the return/expression with a variable assignment. Only the
+        # new nodes need locations, so copy them from the replaced statement
+        # instead of walking the whole tree with ast.fix_missing_locations.
+        value = last.value if last.value is not None else ast.copy_location(ast.Constant(value=None), last)
+        target = ast.copy_location(ast.Name(id='__return_value__', ctx=ast.Store()), last)
+        tree.body[-1] = ast.copy_location(ast.Assign(targets=[target], value=value), last)
+    
+    return compile(tree, '<string>', 'exec'), has_return
+
+
+# Per-thread stdout/stderr capture buffers, reused across executions
+_capture_buffers = threading.local()
+
+# sys.stdout/sys.stderr are process-wide, so in-process executions that redirect
+# them are serialized; pool workers are separate processes and never contend
+_stdio_lock = threading.Lock()
+
+
+def _get_capture_buffers() -> Tuple[io.StringIO, io.StringIO]:
+    """Return this thread's (stdout, stderr) capture buffers, emptied."""
+    buffers = getattr(_capture_buffers, 'buffers', None)
+    if buffers is None:
+        buffers = _capture_buffers.buffers = (io.StringIO(), io.StringIO())
+    for buffer in buffers:
+        buffer.seek(0)
+        buffer.truncate()
+    return buffers
+
+
+def _run_code(code: str, variables: Optional[Dict[str, Any]] = None,
+              allowed_imports: Optional[FrozenSet[str]] = None,
+              return_last_expression: bool = False) -> Dict[str, Any]:
+    """
+    Compile and execute code, capturing its output.
+    
+    Used both in-process and inside pool workers.
+    
+    Args:
+        code: The Python code to execute
+        variables: Variables to inject into the execution context
+        allowed_imports: Top-level modules the code may import, or None to allow all
+        return_last_expression: Whether a trailing bare expression is returned
+    
+    Returns:
+        Dictionary with stdout, stderr, return_value and error (None on
+        success, otherwise a dict with type, message and traceback)
+    """
+    # Reuse this thread's string buffers for capturing stdout/stderr
+    stdout_buffer, stderr_buffer = _get_capture_buffers()
+    
+    # Prepare a fresh, minimal namespace with the injected variables. Agent code
+    # never sees (or mutates) this module's globals, and a single namespace lets
+    # functions defined by the code see its top-level imports and variables.
+    exec_namespace = dict(variables) if isinstance(variables, Mapping) else {}
+    exec_namespace['__builtins__'] = builtins
+    
+    return_value = None
+    error = None
+    
+    try:
+        # Compile the code (handling a trailing return statement), reusing previous compilations
+        compiled_code, has_return = _compile_cached(code, allowed_imports, return_last_expression)
+        
+        # Execute the code and capture stdout/stderr
+        with _stdio_lock:
+            old_stdout, old_stderr = sys.stdout, sys.stderr
+            sys.stdout, sys.stderr = stdout_buffer, stderr_buffer
+            try:
+                # Execute the code string directly
+                exec(compiled_code, exec_namespace)
+            finally:
+                sys.stdout, sys.stderr = old_stdout, old_stderr
+        
+        # Get the return value if there was one
+        if has_return:
+            return_value = exec_namespace.get('__return_value__')
+    except Exception as e:
+        error = {
+            "type": type(e).__name__,
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+    
+    return {
+        "stdout": stdout_buffer.getvalue(),
+        "stderr": stderr_buffer.getvalue(),
+        "return_value": return_value,
+        "error": error
+    }
+
+
+def _worker_main(conn, preload_modules: Tuple[str, ...] = ()) -> None:
+    """Main loop of a pool worker process: run code received over the pipe until told to stop."""
+    # Import commonly used heavy modules once per worker, so agent code doesn't pay
+    # for e.g. numpy/pandas imports on every call. Missing modules are skipped.
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+    
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        
+        payload = _run_code(*message)
+        try:
+            conn.send(payload)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # The return value can't cross the process boundary, send its repr instead
+            payload["return_value"] = repr(payload["return_value"])
+            conn.send(payload)
+
+
+class CodeExecutionTimeout(TimeoutError):
+    """Raised when executed code runs longer than the allowed time."""
+    pass
+
+
+@contextlib.contextmanager
+def _time_limit(seconds: Optional[float]):
+    """
+    Interrupt the enclosed block with CodeExecutionTimeout after the given time.
+    
+    Uses SIGALRM/setitimer, which is Unix-only, and falls back to a timer
+    thread calling _thread.interrupt_main() elsewhere (e.g. Windows). Both
+    mechanisms can only interrupt the main thread, so no limit is applied
+    when called from any other thread.
+    
+    Args:
+        seconds: Time limit in seconds (None or 0 disables the limit)
+    """
+    if not seconds or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
+    message = f"Code execution timed out after {seconds} seconds"
+    
+    if hasattr(signal, 'setitimer'):
+        def _raise_timeout(signum, frame):
+            raise CodeExecutionTimeout(message)
+        
+        old_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+    else:
+        timer = threading.Timer(seconds, _thread.interrupt_main)
+        timer.start()
+        try:
+            yield
+        except KeyboardInterrupt:
+            raise CodeExecutionTimeout(message)
+        finally:
+            timer.cancel()
+
+
+class WorkerPool:
+    """
+    Pool of pre-started Python worker processes for running agent code.
+    
+    Each worker executes code in its own interpreter, so user code can't
+    corrupt the agent's state, runaway code can be killed, and concurrent
+    tool calls run in parallel. Workers are forked where supported to avoid
+    interpreter start-up cost.
+    """
+    
+    def __init__(self, size: int, preload_modules: Optional[List[str]] = None):
+        """
+        Initialize and start the worker pool.
+        
+        Args:
+            size: Number of worker processes
+            preload_modules: Modules each worker imports when it starts (optional)
+        """
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        self._idle: "queue.Queue" = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self.size = size
+        self.preload_modules = tuple(preload_modules or ())
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+    
+    def _start_worker(self):
+        """Start a new worker process and return (process, connection)."""
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_main, args=(child_conn, self.preload_modules), daemon=True)
+        process.start()
+        child_conn.close()
+        worker = (process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+    
+    def _discard_worker(self, worker) -> None:
+        """Kill a worker and forget about it."""
+        process, conn = worker
+        if process.is_alive():
+            process.kill()
+        process.join()
+        conn.close()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+    
+    def run(self, code: str, variables: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None,
+            allowed_imports: Optional[FrozenSet[str]] = None,
+            return_last_expression: bool = False) -> Dict[str, Any]:
+        """
+        Execute code on an idle worker.
+        
+        Args:
+            code: The Python code to execute
+            variables: Variables to inject into the execution context (must be picklable)
+            timeout: Maximum execution time in seconds
+            allowed_imports: Top-level modules the code may import, or None to allow all
+            return_last_expression: Whether a trailing bare expression is returned
+        
+        Returns:
+            The payload produced by the worker (see _run_code)
+        
+        Raises:
+            CodeExecutionTimeout: If the code did not finish in time; the worker is replaced
+            RuntimeError: If the worker died before or while executing the code; it is replaced
+        """
+        worker = self._idle.get()
+        process, conn = worker
+        try:
+            conn.send((code, variables, allowed_imports, return_last_expression))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # The request couldn't be pickled, nothing was sent and the worker is still usable
+            self._idle.put(worker)
+            raise
+        except (EOFError, OSError) as e:
+            # The worker is dead, replace it
+            self._discard_worker(worker)
+            self._idle.put(self._start_worker())
+            raise RuntimeError(f"Code execution worker exited unexpectedly: {e}")
+        
+        try:
+            if conn.poll(timeout):
+                payload = conn.recv()
+                self._idle.put(worker)
+                return payload
+            error = CodeExecutionTimeout(f"Code execution timed out after {timeout} seconds")
+        except (EOFError, OSError) as e:
+            error = RuntimeError(f"Code execution worker exited unexpectedly: {e}")
+        
+        # The worker is hung or dead, replace it
+        self._discard_worker(worker)
+        self._idle.put(self._start_worker())
+        raise error
+    
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            workers = list(self._workers)
+        for process, conn in workers:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in workers:
+            worker[0].join(timeout=1)
+            self._discard_worker(worker)
+
+
 class DynamicCodeExecutionTool(Tool):
     """
     Tool for dynamically executing Python code.
@@ -28,8 +371,8 @@ class DynamicCodeExecutionTool(Tool):
     enabling it to solve complex problems programmatically.
     """
     
-    def __init__(self, 
-                 name: str = "execute_python", 
+    def __init__(self,
+                 name: str = "execute_python",
                  description: str = "Execute Python code dynamically and return the results. "
                   "This is very flexible and can be used when other tools fail. "
                   "Your code should output results to stdout. If your code writes a file (e.g., an image, a document) to the './blob_storage' directory, "
@@ -37,6 +380,9 @@ class DynamicCodeExecutionTool(Tool):
                   "When generating Markdown links or references for files saved in './blob_storage', use the URL path '/blob_storage/' followed by the filename (e.g., '/blob_storage/my_image.png').",
                  max_execution_time: int = 30,
                  allowed_imports: Optional[list] = None,
+                 worker_pool_size: Optional[int] = None,
+                 preload_modules: Optional[List[str]] = None,
+                 return_last_expression: bool = False,
                  event_queue: Optional[EventQueue] = None):
         """
         Initialize the dynamic code execution tool.
@@ -44,15 +390,35 @@ class DynamicCodeExecutionTool(Tool):
         Args:
             name: Name of the tool
             description: Description of what the tool does
-            max_execution_time: Maximum execution time in seconds (not implemented yet)
+            max_execution_time: Maximum execution time in seconds. Always enforced for worker
+                processes; in-process execution is only limited on the main thread
             allowed_imports: List of allowed import modules, if None all imports are allowed
+            worker_pool_size: Number of worker processes to run code in. Defaults to the
+                CATALYST_CODE_WORKERS environment variable; 0 runs code in-process, where
+                concurrent calls are serialized because output capture swaps sys.stdout
+            preload_modules: Modules every worker process imports up front (e.g. numpy, pandas).
+                Defaults to the comma-separated CATALYST_CODE_PRELOAD environment variable
+            return_last_expression: Also return the value of a trailing bare expression
+                (REPL-style), not only of a trailing return statement
             event_queue: Optional event queue for tool events
         """
         super().__init__(name, description, event_queue=event_queue)
         self.max_execution_time = max_execution_time
         self.allowed_imports = allowed_imports
+        self.return_last_expression = return_last_expression
+        # Hashable form used by the compile cache and sent to pool workers
+        self._allowed_imports_set = frozenset(allowed_imports) if allowed_imports is not None else None
         # Initialize logger for the tool instance
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        if worker_pool_size is None:
+            worker_pool_size = int(os.environ.get("CATALYST_CODE_WORKERS", "0") or 0)
+        if preload_modules is None:
+            preload_modules = [m.strip() for m in os.environ.get("CATALYST_CODE_PRELOAD", "").split(",") if m.strip()]
+        self.worker_pool: Optional[WorkerPool] = None
+        if worker_pool_size > 0:
+            self.worker_pool = WorkerPool(worker_pool_size, preload_modules=preload_modules)
+            atexit.register(self.worker_pool.shutdown)
     
     def execute(self, code: str, variables: Optional[Dict[str, Any]] = None) -> ToolResult:
         """
@@ -61,107 +427,92 @@ class DynamicCodeExecutionTool(Tool):
         Args:
             code: The Python code to execute
             variables: Optional dictionary of variables to inject into the execution context
-            
+        
         Returns:
             Result of the code execution with stdout, stderr, and return value
         """
         if not code or not isinstance(code, str):
             return ToolResult.error_result("Code must be a non-empty string")
         
-        # Removed temporary file creation - will execute code string directly
-        # Create string buffers for capturing stdout/stderr
-        stdout_buffer = io.StringIO()
-        stderr_buffer = io.StringIO()
-        
-        # Prepare execution context with injected variables
-        exec_locals = {}
-        if variables and isinstance(variables, dict):
-            exec_locals.update(variables)
+        try:
+            payload = None
+            if self.worker_pool is not None:
+                try:
+                    payload = self.worker_pool.run(code, variables, timeout=self.max_execution_time,
+                                                   allowed_imports=self._allowed_imports_set,
+                                                   return_last_expression=self.return_last_expression)
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    # Injected variables can't be sent to a worker, run in-process instead
+                    self.logger.warning("Falling back to in-process execution: %s", e)
+            if payload is None:
+                with _time_limit(self.max_execution_time):
+                    payload = _run_code(code, variables, self._allowed_imports_set,
+                                        self.return_last_expression)
+        except (CodeExecutionTimeout, RuntimeError) as e:
+            return ToolResult(
+                success=False,
+                data={
+                    "stdout": "",
+                    "stderr": "",
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                },
+                error=f"Error executing code: {str(e)}"
+            )
         
-        # Variable to store the return value if any
-        return_value = None
+        stdout = payload["stdout"]
+        stderr = payload["stderr"]
+        error = payload["error"]
         
-        try:
-            # Check if code has a return statement at the end
-            has_return = False
-            code_lines = code.strip().split('\n')
-            if code_lines and code_lines[-1].startswith('return '):
-                has_return = True
-                # Replace return with a variable assignment
-                code_lines[-1] = f"__return_value__ = {code_lines[-1][7:]}"
-                code = '\n'.join(code_lines)
-            
-            # Execute the code and capture stdout/stderr
-            with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(stderr_buffer):
-                # Execute the code string directly
-                compiled_code = compile(code, '<string>', 'exec')
-                exec(compiled_code, globals(), exec_locals)
-                
-                # Get the return value if there was one
-                if has_return:
-                    return_value = exec_locals.get('__return_value__')
-            
-            # Prepare the result
-            stdout = stdout_buffer.getvalue()
-            stderr = stderr_buffer.getvalue()
-            
-            result_data = {
-                "stdout": stdout,
-                "stderr": stderr,
-                "return_value": return_value
-            }
-
-            print(f"Code execution std result: {result_data}")
-            
-            # Check stderr and stdout for actual error patterns
-            execution_error = None
-            error_keywords = ["error", "exception", "traceback", "failed"] # Case-insensitive check below
-
-            if stderr:
-                stderr_lower = stderr.lower()
-                # Check if stderr contains actual error keywords
-                if any(keyword in stderr_lower for keyword in error_keywords):
-                    execution_error = f"Code execution produced error messages on stderr:\n{stderr}"
-                else:
-                    # Log non-error stderr content as warning but don't fail automatically
-                    self.logger.warning(f"Code execution produced non-error output on stderr (e.g., progress bar):\n{stderr}")
-
-            # Check stdout for "Error:" only if no critical error found in stderr yet
-            if not execution_error and "error:" in stdout.lower():
-                 self.logger.debug("Found 'Error:' pattern in stdout.")
-                 execution_error = f"Code execution produced potential error messages on stdout:\n{stdout}"
-
-            if execution_error:
-                self.logger.warning(f"Code execution flagged as failed due to detected errors: {execution_error}")
-                # Return failure result only if specific error patterns were detected
-                return ToolResult(success=False, data=result_data, error=execution_error)
-            else:
-                # No apparent errors in output, return success
-                self.logger.info(f"Code execution successful. stdout: {stdout[:100]}..., stderr: {stderr[:100]}...")
-                return ToolResult.success_result(result_data)
-            
-        except Exception as e:
-            # Get the traceback information
-            tb = traceback.format_exc()
-            
-            # Include any output up to the error
-            stdout = stdout_buffer.getvalue()
-            stderr = stderr_buffer.getvalue()
-            
-            error_message = f"Error executing code: {str(e)}\n{tb}"
+        if error:
+            tb = error["traceback"]
+            error_message = f"Error executing code: {error['message']}\n{tb}"
             
             # Create a new ToolResult directly instead of using error_result
             # This avoids the issue with the error_result method expecting only one argument
             return ToolResult(
-                success=False, 
+                success=False,
                 data={
                     "stdout": stdout,
                     "stderr": stderr + "\n" + tb,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e)
-                }, 
+                    "error_type": error["type"],
+                    "error_message": error["message"]
+                },
                 error=error_message
             )
+        
+        result_data = {
+            "stdout": stdout,
+            "stderr": stderr,
+            "return_value": payload["return_value"]
+        }
+        
+        self.logger.debug("Code execution std result: %r", result_data)
+        
+        # Check stderr and stdout for actual error patterns
+        execution_error = None
+        
+        if stderr:
+            # Check if stderr contains actual error keywords
+            if _ERROR_RE.search(stderr):
+                execution_error = f"Code execution produced error messages on stderr:\n{stderr}"
+            else:
+                # Log non-error stderr content as warning but don't fail automatically
+                self.logger.warning("Code execution produced non-error output on stderr (e.g., progress bar):\n%s", stderr)
+        
+        # Check stdout for "Error:" only if no critical error found in stderr yet
+        if not execution_error and _STDOUT_ERROR_RE.search(stdout):
+             self.logger.debug("Found 'Error:' pattern in stdout.")
+             execution_error = f"Code execution produced potential error messages on stdout:\n{stdout}"
+        
+        if execution_error:
+            self.logger.warning("Code execution flagged as failed due to detected errors: %s", execution_error)
+            # Return failure result only if specific error patterns were detected
+            return ToolResult(success=False, data=result_data, error=execution_error)
+        else:
+            # No apparent errors in output, return success
+            self.logger.info("Code execution successful. stdout: %.100s..., stderr: %.100s...", stdout, stderr)
+            return ToolResult.success_result(result_data)
     
     def get_schema(self) -> Dict[str, Any]:
         """
@@ -188,4 +539,4 @@ class DynamicCodeExecutionTool(Tool):
                 "description": "Result of the code execution with stdout, stderr, and return value"
             },
             "example": 'execute_python(code="import datetime\\nprint(f\\"Current date and time: {datetime.datetime.now()}\\")")'
-        }
\ No newline at end of file
+        }
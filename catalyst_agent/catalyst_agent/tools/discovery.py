@@ -9,6 +9,8 @@ import os
 import importlib
 import inspect
 import logging
+import functools
+import concurrent.futures
 from typing import Dict, Type
 
 from ..utils import setup_logger
@@ -20,32 +22,62 @@ def discover_tools() -> Dict[str, Type[Tool]]:
     Discover available tool classes in the tools package.
     
     This function scans the tools directory and finds all classes that
-    inherit from the Tool base class.
+    inherit from the Tool base class. The scan is cached and only repeated
+    when the tools directory changes.
     
+    Returns:
+        Dictionary mapping tool class names to the tool classes
+    """
+    tools_dir = os.path.dirname(__file__)
+    return dict(_discover_tools_cached(tools_dir, os.stat(tools_dir).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_tools_cached(tools_dir: str, mtime_ns: int) -> Dict[str, Type[Tool]]:
+    """
+    Scan a tools directory for Tool subclasses.
+    
+    Args:
+        tools_dir: Directory containing the tool modules
+        mtime_ns: Modification time of the directory, so adding or removing
+            tool files invalidates the cache
+        
     Returns:
         Dictionary mapping tool class names to the tool classes
     """
     logger = setup_logger('agentic.tools.discovery')
     tool_classes = {}
     
-    # Get the directory containing the tools
-    tools_dir = os.path.dirname(__file__)
     logger.info(f"Discovering tools in {tools_dir}")
     
     # Get a list of all Python files in the tools directory (excluding __init__.py and base.py)
     tool_files = [f[:-3] for f in os.listdir(tools_dir) 
                  if f.endswith('.py') and f != '__init__.py' and f != 'base.py' and f != 'discovery.py']
     
-    for file_name in tool_files:
+    def import_tool_module(file_name):
+        """Import a tool module, returning (module, error)."""
         try:
             # Import the module dynamically
             module_name = f".{file_name}"
-            module = importlib.import_module(module_name, package="catalyst_agent.catalyst_agent.tools")
-            
-            # Find all Tool subclasses in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Tool) and 
+            return importlib.import_module(module_name, package="catalyst_agent.catalyst_agent.tools"), None
+        except Exception as e:
+            return None, e
+    
+    # Import modules in parallel; most of the time is spent reading files, which releases the GIL
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tool_files) or 1)) as executor:
+        imported = list(executor.map(import_tool_module, tool_files))
+    
+    for file_name, (module, error) in zip(tool_files, imported):
+        if error is not None:
+            logger.error(f"Error discovering tools in {file_name}: {str(error)}")
+            continue
+        
+        try:
+            # Find all Tool subclasses in the module (vars() avoids getmembers' sort and getattr calls)
+            for name, obj in vars(module).items():
+                if not inspect.isclass(obj):
+                    continue
+                if (issubclass(obj, Tool) and 
                     obj != Tool and  # Skip the base Tool class itself
                     obj.__module__ == module.__name__):
                     tool_classes[name] = obj
@@ -6,43 +6,61 @@ directly to the local filesystem.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import re
 import uuid
-from pathlib import Path
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, unquote
 from .base import Tool, ToolResult
 from catalyst_agent.event_queue import EventQueue
 
+# Translation table mapping characters that are invalid in filenames (and control characters) to '_'
+_UNSAFE_FILENAME_CHARS = dict.fromkeys(map(ord, '<>:"/\\|?*'), ord('_'))
+_UNSAFE_FILENAME_CHARS.update({c: ord('_') for c in range(0x20)})
+
+# Size of the chunks downloads are streamed in
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Content-Disposition filename patterns: filename*=UTF-8''name and filename="name"
+_RE_CD_UTF8 = re.compile(r"filename\*=UTF-8''([^;]+)", re.IGNORECASE)
+_RE_CD_ASCII = re.compile(r'filename="([^"]+)"', re.IGNORECASE)
+
 # Helper function to sanitize filenames
 def sanitize_filename(filename: str) -> str:
     """Remove potentially unsafe characters from a filename."""
     # Remove path components
     filename = filename.split('/')[-1].split('\\')[-1]
     # Replace invalid characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    sanitized = filename.translate(_UNSAFE_FILENAME_CHARS)
     # Limit length to avoid issues with filesystem limits
     return sanitized[:200]
 
-# Helper function to get filename from Content-Disposition header
-def get_filename_from_headers(headers: Dict[str, str]) -> Optional[str]:
-    """Extract filename from Content-Disposition header."""
-    content_disposition = headers.get('Content-Disposition')
+# Helper function to get filename from a Content-Disposition header value
+@functools.lru_cache(maxsize=256)
+def get_filename_from_cd(content_disposition: Optional[str]) -> Optional[str]:
+    """Extract filename from a Content-Disposition header value."""
     if content_disposition:
         # Regex to find filename*=UTF-8'' or filename="filename.ext"
-        match_utf8 = re.search(r"filename\*=UTF-8''([^;]+)", content_disposition, re.IGNORECASE)
+        match_utf8 = _RE_CD_UTF8.search(content_disposition)
         if match_utf8:
             filename = unquote(match_utf8.group(1))
             return sanitize_filename(filename)
 
-        match_ascii = re.search(r'filename="([^"]+)"', content_disposition, re.IGNORECASE)
+        match_ascii = _RE_CD_ASCII.search(content_disposition)
         if match_ascii:
             filename = match_ascii.group(1)
             return sanitize_filename(filename)
     return None
 
+# Helper function to get filename from Content-Disposition header
+def get_filename_from_headers(headers: Dict[str, str]) -> Optional[str]:
+    """Extract filename from Content-Disposition header."""
+    return get_filename_from_cd(headers.get('Content-Disposition'))
+
 # Helper function to get filename from URL path
+@functools.lru_cache(maxsize=256)
 def get_filename_from_url(url: str) -> Optional[str]:
     """Extract filename from the URL path."""
     try:
@@ -71,6 +89,7 @@ class DownloadFileTool(Tool):
                  name: str = "download_file",
                  description: str = "Download content from a URL and save it to a local file. Returns the file path and metadata.",
                  default_output_dir: str = "data/downloads",
+                 session: Optional[requests.Session] = None,
                  event_queue: Optional[EventQueue] = None):
         """
         Initialize the download file tool.
@@ -79,6 +98,8 @@ class DownloadFileTool(Tool):
             name: Name of the tool.
             description: Description of what the tool does.
             default_output_dir: Default directory to save downloaded files (relative to workspace root).
+            session: Optional requests session to use. By default a pooled session is created
+                     so connections (and TLS handshakes) are reused across downloads.
             event_queue: Optional event queue for logging/events.
         """
         super().__init__(name, description, event_queue=event_queue)
@@ -86,31 +107,83 @@ class DownloadFileTool(Tool):
         self.default_output_dir_rel = default_output_dir
         # Assume workspace root is the current working directory when the tool is initialized
         # In a real scenario, this might need to be passed in or determined differently.
-        self.workspace_root = Path.cwd() # Or get from config
+        self.workspace_root = os.getcwd() # Or get from config
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
 
-    def _resolve_path(self, relative_path: str) -> Path:
+    def _resolve_path(self, relative_path: str) -> str:
         """Resolve a relative path against the workspace root."""
-        return (self.workspace_root / relative_path).resolve()
+        return os.path.abspath(os.path.join(self.workspace_root, relative_path))
+
+    def _is_within_workspace(self, path: str) -> bool:
+        """Check that a path (with symlinks resolved) lies inside the workspace root."""
+        root = os.path.realpath(self.workspace_root)
+        return os.path.commonpath([os.path.realpath(path), root]) == root
+
+    def _get_unique_filename(self, dir_path: str, filename: str) -> Tuple[int, str]:
+        """
+        Atomically create a new file, picking a unique name if the target already exists.
 
-    def _get_unique_filename(self, dir_path: Path, filename: str) -> Path:
-        """Generate a unique filename if the target file already exists."""
-        filepath = dir_path / filename
-        if not filepath.exists():
-            return filepath
+        Uses O_CREAT|O_EXCL so checking for and creating the file is a single
+        syscall with no race between the two.
 
-        # File exists, generate a unique name
+        Returns:
+            Tuple of (open file descriptor for writing, path of the created file)
+        """
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
         base, ext = os.path.splitext(filename)
-        counter = 1
+        candidate = filename
+        counter = 0
         while True:
-            new_filename = f"{base}_{counter}{ext}"
-            new_filepath = dir_path / new_filename
-            if not new_filepath.exists():
-                return new_filepath
+            filepath = os.path.join(dir_path, candidate)
+            try:
+                return os.open(filepath, flags, 0o644), filepath
+            except FileExistsError:
+                pass
+
+            # File exists, generate a unique name
             counter += 1
             if counter > 1000: # Safety break
                  # Fallback to UUID if too many conflicts
-                 return dir_path / f"{base}_{uuid.uuid4().hex[:8]}{ext}"
+                 candidate = f"{base}_{uuid.uuid4().hex[:8]}{ext}"
+            else:
+                 candidate = f"{base}_{counter}{ext}"
+
+
+    @staticmethod
+    def _preallocate(fd: int, response: requests.Response) -> bool:
+        """
+        Reserve disk space for the download when its size is known up front.
+
+        Allocating the whole file in one posix_fallocate call lets the
+        filesystem pick contiguous extents instead of growing the file chunk
+        by chunk. Failures (unsupported filesystem, no space) are ignored and
+        the download proceeds normally.
 
+        Returns:
+            True if space was reserved, False otherwise
+        """
+        if not hasattr(os, 'posix_fallocate'):
+            return False
+        # With a content encoding, Content-Length is the compressed size, not the file size
+        if response.headers.get('Content-Encoding', 'identity') != 'identity':
+            return False
+        try:
+            size_hint = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            return False
+        if size_hint <= 0:
+            return False
+        try:
+            os.posix_fallocate(fd, 0, size_hint)
+        except OSError:
+            return False
+        return True
 
     def execute(self, url: str, output_dir: Optional[str] = None, filename: Optional[str] = None) -> ToolResult:
         """
@@ -137,55 +210,74 @@ class DownloadFileTool(Tool):
             # 2. Determine and ensure output directory exists
             target_dir_rel = output_dir or self.default_output_dir_rel
             target_dir_abs = self._resolve_path(target_dir_rel)
+            if not self._is_within_workspace(target_dir_abs):
+                return ToolResult.error_result(f"Output directory '{target_dir_rel}' is outside the workspace")
 
             try:
-                target_dir_abs.mkdir(parents=True, exist_ok=True)
+                os.makedirs(target_dir_abs, exist_ok=True)
             except OSError as e:
                 return ToolResult.error_result(f"Failed to create output directory '{target_dir_abs}': {e}")
 
             # 3. Fetch content with streaming
             headers = {"User-Agent": "CatalystAgent/1.0"} # Basic user agent
-            response = requests.get(url, headers=headers, stream=True, timeout=30) # 30s timeout
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+            with self._session.get(url, headers=headers, stream=True, timeout=30) as response: # 30s timeout
+                response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
 
-            # 4. Determine filename
-            final_filename = None
-            if filename: # User-provided filename takes precedence
-                final_filename = sanitize_filename(filename)
-            else:
-                final_filename = get_filename_from_headers(response.headers)
-                if not final_filename:
-                    final_filename = get_filename_from_url(url)
-                if not final_filename:
-                    # Fallback if no name could be derived
-                    content_type = response.headers.get('Content-Type', 'application/octet-stream').split(';')[0]
-                    ext = f".{content_type.split('/')[-1]}" if '/' in content_type else ".bin"
-                    final_filename = f"download_{uuid.uuid4().hex[:8]}{ext}"
-
-            # 5. Handle conflicts and get final path
-            target_filepath_abs = self._get_unique_filename(target_dir_abs, final_filename)
-            target_filepath_rel = target_filepath_abs.relative_to(self.workspace_root)
-
-            # 6. Stream response to file
-            file_size = 0
-            chunk_size = 8192 # 8KB chunks
-            with open(target_filepath_abs, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk: # filter out keep-alive new chunks
-                        f.write(chunk)
-                        file_size += len(chunk)
-
-            # 7. Gather metadata
-            content_type = response.headers.get('Content-Type', 'unknown')
-
-            result_data = {
-                "local_path": str(target_filepath_rel),
-                "original_url": url,
-                "content_type": content_type,
-                "file_size": file_size,
-                "status": "Download successful"
-            }
-            return ToolResult.success_result(result_data)
+                # 4. Determine filename
+                final_filename = None
+                if filename: # User-provided filename takes precedence
+                    final_filename = sanitize_filename(filename)
+                else:
+                    final_filename = get_filename_from_cd(response.headers.get('Content-Disposition'))
+                    if not final_filename:
+                        final_filename = get_filename_from_url(url)
+                    if not final_filename:
+                        # Fallback if no name could be derived
+                        content_type = response.headers.get('Content-Type', 'application/octet-stream').split(';')[0]
+                        ext = f".{content_type.split('/')[-1]}" if '/' in content_type else ".bin"
+                        final_filename = f"download_{uuid.uuid4().hex[:8]}{ext}"
+
+                # 5. Handle conflicts and create the target file
+                if not self._is_within_workspace(os.path.join(target_dir_abs, final_filename)):
+                    return ToolResult.error_result(f"Filename '{final_filename}' resolves outside the workspace")
+                fd, target_filepath_abs = self._get_unique_filename(target_dir_abs, final_filename)
+
+                # 6. Stream response to file in 1MB chunks
+                try:
+                    f = os.fdopen(fd, 'wb')
+                except BaseException:
+                    os.close(fd)
+                    os.unlink(target_filepath_abs)
+                    raise
+                try:
+                    file_size = 0
+                    with f:
+                        preallocated = self._preallocate(f.fileno(), response)
+                        # iter_content undoes gzip/deflate encoding and, unlike a raw read loop,
+                        # doesn't stop early when a compressed chunk decodes to no bytes
+                        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            file_size += len(chunk)
+                        if preallocated:
+                            # Drop any reserved space beyond what was actually written (e.g. short reads)
+                            f.truncate()
+                except BaseException:
+                    # Don't leave a partial download behind
+                    os.unlink(target_filepath_abs)
+                    raise
+
+                # 7. Gather metadata
+                target_filepath_rel = os.path.relpath(target_filepath_abs, self.workspace_root)
+                content_type = response.headers.get('Content-Type', 'unknown')
+
+                result_data = {
+                    "local_path": str(target_filepath_rel),
+                    "original_url": url,
+                    "content_type": content_type,
+                    "file_size": file_size,
+                    "status": "Download successful"
+                }
+                return ToolResult.success_result(result_data)
 
         except requests.exceptions.Timeout:
             return ToolResult.error_result(f"Timeout error fetching URL: {url}")
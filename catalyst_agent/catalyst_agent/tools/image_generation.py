@@ -6,8 +6,11 @@ various image generation services.
 """
 
 import os
-import base64
+import binascii
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union
 from .base import Tool, ToolResult
 from catalyst_agent.event_queue import EventQueue
@@ -23,6 +26,8 @@ class ImageGenerationTool(Tool):
     SUPPORTED_MODELS = ["dall-e-3"]
     SUPPORTED_SIZES = ["1024x1024", "1792x1024", "1024x1792"]
     SUPPORTED_QUALITIES = ["standard", "hd"]
+    # (connect, read) timeouts in seconds; generation itself can take a while
+    DEFAULT_TIMEOUT = (10, 120)
     
     def __init__(self, 
                  name: str = "generate_image", 
@@ -34,6 +39,7 @@ class ImageGenerationTool(Tool):
                  quality: str = "standard",
                  response_format: str = "url",
                  save_directory: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
                  event_queue: Optional[EventQueue] = None):
         """
         Initialize the image generation tool.
@@ -48,6 +54,8 @@ class ImageGenerationTool(Tool):
             quality: Image quality (default: "standard")
             response_format: Response format (url or b64_json)
             save_directory: Directory to save images (if None, images are not saved)
+            session: Optional requests session to use. By default a pooled session is created
+                     so connections (and TLS handshakes) are reused across calls.
         """
         super().__init__(name, description, event_queue=event_queue)
         
@@ -81,8 +89,15 @@ class ImageGenerationTool(Tool):
         self.save_directory = save_directory
         
         # Create save directory if it doesn't exist
-        if self.save_directory and not os.path.exists(self.save_directory):
-            os.makedirs(self.save_directory)
+        if self.save_directory:
+            os.makedirs(self.save_directory, exist_ok=True)
+        
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
     
     def execute(self, prompt: str, n: int = 1, filename: Optional[str] = None) -> ToolResult:
         """
@@ -120,7 +135,7 @@ class ImageGenerationTool(Tool):
             }
             
             # Make the API call
-            response = requests.post(self.endpoint, headers=headers, json=payload)
+            response = self._session.post(self.endpoint, headers=headers, json=payload, timeout=self.DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -129,6 +144,8 @@ class ImageGenerationTool(Tool):
                 "prompt": prompt,
                 "images": []
             }
+            # (image_info, save function, image url/base64, target path) for images to save to disk
+            save_jobs = []
             
             for i, image_data in enumerate(data.get("data", [])):
                 image_url = image_data.get("url", "")
@@ -144,8 +161,7 @@ class ImageGenerationTool(Tool):
                     
                     # Save the image if a save directory is specified
                     if self.save_directory:
-                        saved_path = self._save_image_from_url(image_url, i, filename)
-                        image_info["saved_path"] = saved_path
+                        save_jobs.append((image_info, self._save_image_from_url, image_url, self._build_path(i, filename)))
                         
                 elif self.response_format == "b64_json" and image_b64:
                     # For space efficiency, don't include the full base64 in the result
@@ -153,68 +169,82 @@ class ImageGenerationTool(Tool):
                     
                     # Save the image if a save directory is specified
                     if self.save_directory:
-                        saved_path = self._save_image_from_b64(image_b64, i, filename)
-                        image_info["saved_path"] = saved_path
+                        save_jobs.append((image_info, self._save_image_from_b64, image_b64, self._build_path(i, filename)))
                 
                 result["images"].append(image_info)
             
+            # Download/write the images concurrently; the GIL is released during network and disk I/O
+            if len(save_jobs) == 1:
+                image_info, save, image_source, path = save_jobs[0]
+                image_info["saved_path"] = save(image_source, path)
+            elif save_jobs:
+                with ThreadPoolExecutor(max_workers=len(save_jobs)) as executor:
+                    futures = [
+                        (image_info, executor.submit(save, image_source, path))
+                        for image_info, save, image_source, path in save_jobs
+                    ]
+                    for image_info, future in futures:
+                        image_info["saved_path"] = future.result()
+            
             return ToolResult.success_result(result)
         
         except Exception as e:
             return ToolResult.error_result(f"Error generating image: {str(e)}")
     
-    def _save_image_from_url(self, url: str, index: int, custom_filename: Optional[str] = None) -> str:
+    def _build_path(self, index: int, custom_filename: Optional[str] = None) -> str:
         """
-        Download and save an image from a URL.
+        Build the path an image is saved to.
         
         Args:
-            url: The image URL
             index: Image index for filename
             custom_filename: Optional custom filename (without extension)
             
         Returns:
-            Path to the saved image
+            Path inside the save directory
         """
-        response = requests.get(url)
-        response.raise_for_status()
-        
         if custom_filename:
             # If multiple images are being generated, append index to avoid overwriting
             if index > 0:
-                filename = os.path.join(self.save_directory, f"{custom_filename}_{index+1}.png")
-            else:
-                filename = os.path.join(self.save_directory, f"{custom_filename}.png")
-        else:
-            filename = os.path.join(self.save_directory, f"generated_image_{index+1}.png")
+                return os.path.join(self.save_directory, f"{custom_filename}_{index+1}.png")
+            return os.path.join(self.save_directory, f"{custom_filename}.png")
+        return os.path.join(self.save_directory, f"generated_image_{index+1}.png")
+    
+    def _save_image_from_url(self, url: str, filename: str) -> str:
+        """
+        Download and save an image from a URL.
         
-        with open(filename, "wb") as f:
-            f.write(response.content)
+        Args:
+            url: The image URL
+            filename: Path to save the image to
+            
+        Returns:
+            Path to the saved image
+        """
+        # Stream the body straight to disk in 1MB chunks instead of holding the whole image in memory
+        with self._session.get(url, stream=True, timeout=self.DEFAULT_TIMEOUT) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(filename, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
         
         return filename
     
-    def _save_image_from_b64(self, b64_data: str, index: int, custom_filename: Optional[str] = None) -> str:
+    def _save_image_from_b64(self, b64_data: str, filename: str) -> str:
         """
         Save an image from base64 data.
         
         Args:
             b64_data: Base64 encoded image data
-            index: Image index for filename
-            custom_filename: Optional custom filename (without extension)
+            filename: Path to save the image to
             
         Returns:
             Path to the saved image
         """
-        if custom_filename:
-            # If multiple images are being generated, append index to avoid overwriting
-            if index > 0:
-                filename = os.path.join(self.save_directory, f"{custom_filename}_{index+1}.png")
-            else:
-                filename = os.path.join(self.save_directory, f"{custom_filename}.png")
-        else:
-            filename = os.path.join(self.save_directory, f"generated_image_{index+1}.png")
-        
+        # a2b_base64 decodes the ASCII str directly in C (skipping newlines), without
+        # b64decode's Python-level argument conversion
+        data = binascii.a2b_base64(b64_data)
         with open(filename, "wb") as f:
-            f.write(base64.b64decode(b64_data))
+            f.write(data)
         
         return filename
     
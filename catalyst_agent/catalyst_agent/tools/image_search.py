@@ -5,8 +5,12 @@ This module provides a tool that allows agents to search for images using Google
 """
 
 import os
+import time
+import threading
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from .base import Tool, ToolResult
 from catalyst_agent.event_queue import EventQueue
 
@@ -18,12 +22,20 @@ class ImageSearchTool(Tool):
     Requires Google API Key and Custom Search Engine ID configured for image search.
     """
 
+    # (connect, read) timeouts in seconds
+    DEFAULT_TIMEOUT = (10, 30)
+    # Escapes brackets in alt text so they don't break the Markdown image tag
+    _MD_ESCAPE = str.maketrans({"[": "\\[", "]": "\\]"})
+
     def __init__(self,
                  name: str = "image_search",
                  description: str = "Search for images related to a query.",
                  api_key: Optional[str] = None,
                  cx_id: Optional[str] = None,
                  max_results: int = 10, # Google API typically returns 10 images max per request
+                 session: Optional[requests.Session] = None,
+                 cache_ttl: float = 300.0,
+                 cache_size: int = 256,
                  event_queue: Optional[EventQueue] = None):
         """
         Initialize the Image search tool.
@@ -34,6 +46,10 @@ class ImageSearchTool(Tool):
             api_key: Google API key (if None, will try to load from GOOGLE_API_KEY environment variable)
             cx_id: Google Custom Search Engine ID (if None, will try to load from GOOGLE_CX_ID environment variable)
             max_results: Maximum number of image results to return (limited by API)
+            session: Optional requests session to use. By default a pooled session is created
+                     so connections (and TLS handshakes) are reused across searches.
+            cache_ttl: Seconds a search result is reused for identical queries (0 disables caching)
+            cache_size: Maximum number of cached search results
             event_queue: Optional event queue for logging/events
         """
         super().__init__(name, description, event_queue=event_queue)
@@ -55,6 +71,19 @@ class ImageSearchTool(Tool):
         self.cx_id = cx_id
         self.max_results = min(max_results, 10) # Enforce API limit
 
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+
+        # (query, num_results) -> (monotonic timestamp, Markdown result), in LRU order
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def execute(self, query: str, max_results: Optional[int] = None) -> ToolResult:
         """
         Execute an image search with the provided query.
@@ -97,6 +126,40 @@ class ImageSearchTool(Tool):
         """
         Perform an image search using the Google Custom Search JSON API and return the first result as Markdown.
 
+        Results are cached for ``cache_ttl`` seconds, so repeated identical queries skip the HTTP round trip.
+
+        Args:
+            query: The search query
+            num_results: The number of results to request from the API (1-10)
+
+        Returns:
+            A Markdown image tag string for the first result, or a 'No image found' message.
+        """
+        key = (query, num_results)
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    timestamp, markdown = cached
+                    if time.monotonic() - timestamp < self.cache_ttl:
+                        self._cache.move_to_end(key)
+                        return markdown
+                    del self._cache[key]
+
+        markdown = self._fetch_first_image(query, num_results)
+
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), markdown)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return markdown
+
+    def _fetch_first_image(self, query: str, num_results: int) -> str:
+        """
+        Query the Google Custom Search JSON API and format the first image as Markdown.
+
         Args:
             query: The search query
             num_results: The number of results to request from the API (1-10)
@@ -113,7 +176,7 @@ class ImageSearchTool(Tool):
             "num": num_results
         }
 
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params, timeout=self.DEFAULT_TIMEOUT)
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
         data = response.json()
 
@@ -126,7 +189,7 @@ class ImageSearchTool(Tool):
 
             if image_url:
                 # Escape potential Markdown characters in title (like brackets)
-                safe_title = title.replace("[", "\\[").replace("]", "\\]")
+                safe_title = title.translate(self._MD_ESCAPE)
                 return f"![{safe_title}]({image_url})"
             else:
                 return f"Found an image result for '{query}' but it missing a URL."
@@ -9,12 +9,122 @@ import os
 import sys
 import subprocess
 import re
+import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+import functools
+import tempfile
+from collections import deque
+from typing import Dict, List, Any, Optional, Set, Union
 from .base import Tool, ToolResult
 from catalyst_agent.event_queue import EventQueue
 import importlib
-import pkg_resources
+import importlib.util
+
+# Base pip command. Skipping pip's self version check avoids a network round trip
+# (and the cache file I/O that goes with it) on every invocation, and --no-input
+# makes pip fail fast instead of hanging on a prompt nobody can answer.
+_PIP_CMD = (sys.executable, "-m", "pip", "--disable-pip-version-check", "--no-input")
+
+# Number of trailing pip output lines kept for the tool result
+_PIP_OUTPUT_LINES = 200
+
+# Start of a version specifier, extras list, environment marker or direct URL in a requirement
+_SPEC_RE = re.compile(r"[<>=!~\[;@]")
+
+# Error message patterns that name a missing module, in priority order
+_ERR_PATTERNS = (
+    # "No module named 'module_name'" / "No module named \"module_name\""
+    re.compile(r"No module named ['\"]([^'\"]+)['\"]"),
+    # "Missing optional dependency 'module_name'" / "... \"module_name\""
+    re.compile(r"Missing optional dependency ['\"]([^'\"]+)['\"]"),
+)
+
+# PEP 503 name normalization: runs of '-', '_' and '.' are equivalent, case-insensitive
+_NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_missing_module(error_message: str) -> Optional[str]:
+    """
+    Extract the name of the missing module from an import error message.
+    
+    Memoized since the same error tends to recur across retries.
+    
+    Args:
+        error_message: The error message to inspect
+        
+    Returns:
+        The module name, or None if no known pattern matches
+    """
+    for pattern in _ERR_PATTERNS:
+        match = pattern.search(error_message)
+        if match:
+            # Add more specific package name mappings here if needed (e.g., some libs have different import vs pip names)
+            # Example: if module_name == 'PIL': module_name = 'Pillow'
+            return match.group(1)
+    return None
+
+
+def _canonicalize_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return _NAME_SEPARATORS_RE.sub("-", name).lower()
+
+
+def _requirement_key(requirement: str) -> str:
+    """Normalize a requirement string (canonical name, specifier without whitespace)."""
+    name = _SPEC_RE.split(requirement, 1)[0].strip()
+    rest = requirement.strip()[len(name):]
+    return _canonicalize_name(name) + "".join(rest.split())
+
+
+# Requirement keys known to be satisfied in this process, so repeated requests
+# for the same packages skip both the installed checks and pip entirely
+_VERIFIED: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_dists() -> frozenset:
+    """
+    Snapshot the canonical names of all installed distributions.
+    
+    Scans the installed metadata once instead of once per package check.
+    Cleared after every successful install.
+    
+    Returns:
+        Frozenset of canonicalized distribution names
+    """
+    # Imported here since importlib.metadata pulls in email, zipfile and csv,
+    # which processes that never check packages shouldn't pay for
+    from importlib.metadata import distributions
+    
+    names = set()
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            names.add(_canonicalize_name(name))
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+    
+    Uses importlib.util.find_spec, which only walks the import finders, so
+    heavy packages aren't executed (and loaded into sys.modules) just to
+    test for their presence. Cleared after every successful install.
+    
+    Args:
+        name: Module name
+        
+    Returns:
+        True if a spec for the module was found
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Parent package missing or invalid module name
+        return False
 
 class PackageInstallerTool(Tool):
     """Tool for installing Python packages using pip."""
@@ -22,13 +132,26 @@ class PackageInstallerTool(Tool):
     def __init__(self,
                  name: str = "package_installer",
                  description: str = "Install Python packages using pip. Can check if packages are installed and install missing ones.",
+                 parallel_workers: int = 1,
                  event_queue: Optional[Any] = None):
-        """Initialize the package installer tool."""
+        """
+        Initialize the package installer tool.
+        
+        Args:
+            name: Name of the tool
+            description: Description of what the tool does
+            parallel_workers: Number of concurrent pip downloads used when every
+                requested package is pinned with '=='. The full dependency closure is
+                resolved first and downloaded in parallel, then installed by a single pip
+                process.
+            event_queue: Optional event queue for tool events
+        """
         super().__init__(
             name="package_installer",
             description="Install Python packages using pip. Can check if packages are installed and install missing ones.",
             event_queue=event_queue
         )
+        self.parallel_workers = max(1, parallel_workers)
         # Initialize logger for the tool instance
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
@@ -49,36 +172,42 @@ class PackageInstallerTool(Tool):
         # Check which packages need to be installed
         packages_to_install = []
         already_installed = []
+        # Requirements with version specifiers, extras or markers; pip decides if they're satisfied
+        needs_resolution = []
         
         for package in packages:
-            # Split package name from version if present
-            if "==" in package:
-                package_name = package.split("==")[0]
-            elif ">=" in package:
-                package_name = package.split(">=")[0]
-            elif "<=" in package:
-                package_name = package.split("<=")[0]
-            else:
-                package_name = package
-                
+            # Split package name from version specifier / extras if present
+            package_name = _SPEC_RE.split(package, 1)[0].strip()
+            
             # Check if package is already installed
-            try:
-                if not upgrade:
-                    importlib.import_module(package_name)
+            if not upgrade:
+                if _requirement_key(package) in _VERIFIED:
+                    already_installed.append(package)
+                    continue
+                if package_name != package.strip():
+                    needs_resolution.append(package)
+                    continue
+                if _has_module(package_name):
                     already_installed.append(package)
                     continue
-            except ImportError:
                 # Some packages have different import names than their PyPI names
-                try:
-                    pkg_resources.get_distribution(package_name)
-                    if not upgrade:
-                        already_installed.append(package)
-                        continue
-                except pkg_resources.DistributionNotFound:
-                    pass
+                if _canonicalize_name(package_name) in _installed_dists():
+                    already_installed.append(package)
+                    continue
             
             packages_to_install.append(package)
         
+        if needs_resolution:
+            would_install = self._pip_dry_run(needs_resolution)
+            for package in needs_resolution:
+                package_name = _SPEC_RE.split(package, 1)[0].strip()
+                if would_install is None or _canonicalize_name(package_name) in would_install:
+                    packages_to_install.append(package)
+                else:
+                    already_installed.append(package)
+        
+        _VERIFIED.update(_requirement_key(package) for package in already_installed)
+        
         if not packages_to_install:
             return ToolResult.success_result({
                 "message": "All packages are already installed",
@@ -88,28 +217,175 @@ class PackageInstallerTool(Tool):
         
         # Install packages using pip
         try:
-            cmd = [sys.executable, "-m", "pip", "install"]
-            if upgrade:
-                cmd.append("--upgrade")
-            cmd.extend(packages_to_install)
+            if (self.parallel_workers > 1 and len(packages_to_install) > 1
+                    and all("==" in package for package in packages_to_install)):
+                output = self._install_parallel(packages_to_install, upgrade)
+            else:
+                args = ["install"]
+                if upgrade:
+                    args.append("--upgrade")
+                args.extend(packages_to_install)
+                output = self._run_pip(args)
             
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            # Make the newly installed packages visible to later checks and imports
+            _has_module.cache_clear()
+            _installed_dists.cache_clear()
+            importlib.invalidate_caches()
+            _VERIFIED.update(_requirement_key(package) for package in packages_to_install)
             
             return ToolResult.success_result({
                 "message": "Packages installed successfully",
                 "installed": packages_to_install,
                 "already_installed": already_installed,
-                "output": process.stdout
+                "output": output
             })
         except subprocess.CalledProcessError as e:
-            return ToolResult.error_result(
-                f"Error installing packages: {e}\nOutput: {e.stdout}\nError: {e.stderr}"
-            )
+            error = f"Error installing packages: {e}\nOutput: {e.stdout}"
+            if e.stderr:
+                error += f"\nError: {e.stderr}"
+            return ToolResult.error_result(error)
+    
+    @staticmethod
+    def reset() -> None:
+        """Forget which packages were verified as installed in this process."""
+        _VERIFIED.clear()
+    
+    def _run_pip(self, args: List[str]) -> str:
+        """
+        Run a pip command.
+        
+        Output is streamed line by line and only the last ``_PIP_OUTPUT_LINES``
+        lines are kept, so large installs neither buffer megabytes of
+        progress output nor push it into the agent's context.
+        
+        Args:
+            args: Arguments to pass to pip
+            
+        Returns:
+            The tail of pip's combined stdout/stderr output
+            
+        Raises:
+            subprocess.CalledProcessError: If pip exits with an error (with the
+                output tail as ``output``)
+        """
+        cmd = list(_PIP_CMD) + args
+        tail = deque(maxlen=_PIP_OUTPUT_LINES)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as process:
+            for line in process.stdout:
+                tail.append(line)
+            returncode = process.wait()
+        
+        output = "".join(tail)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+        return output
+    
+    def _install_parallel(self, packages: List[str], upgrade: bool) -> str:
+        """
+        Install pinned packages, downloading them with several concurrent pip processes.
+        
+        pip first resolves the full set of distributions to install (the
+        requested packages plus their missing dependencies). That resolved set
+        is sharded round-robin over ``parallel_workers`` ``pip download``
+        processes writing to a temporary directory. Only the download runs in
+        parallel: a single ``pip install`` then installs everything from that
+        directory, so concurrent processes never touch site-packages. If the
+        set can't be resolved, a single regular pip install is run instead.
+        
+        Args:
+            packages: Pinned requirements to install
+            upgrade: Whether to pass --upgrade
+            
+        Returns:
+            Combined pip output of the downloads and the install
+            
+        Raises:
+            subprocess.CalledProcessError: If a download (after all finished) or the install failed
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        resolved = self._pip_resolve(packages, upgrade)
+        if resolved is None:
+            return self._run_pip(["install"] + (["--upgrade"] if upgrade else []) + packages)
+        if not resolved:
+            return ""
+        
+        workers = min(self.parallel_workers, len(resolved))
+        shards = [resolved[i::workers] for i in range(workers)]
+        with tempfile.TemporaryDirectory(prefix="catalyst-pip-") as download_dir:
+            download_args = ["download", "--no-deps", "--dest", download_dir]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._run_pip, download_args + shard) for shard in shards]
+            
+            outputs = []
+            first_error = None
+            for future in futures:
+                try:
+                    outputs.append(future.result())
+                except subprocess.CalledProcessError as e:
+                    first_error = first_error or e
+            if first_error is not None:
+                raise first_error
+            
+            install_args = ["install", "--no-deps", "--no-index", "--find-links", download_dir]
+            if upgrade:
+                install_args.append("--upgrade")
+            outputs.append(self._run_pip(install_args + resolved))
+        return "".join(outputs)
+    
+    def _pip_dry_run(self, requirements: List[str]) -> Optional[set]:
+        """
+        Ask pip which of the given requirements are not yet satisfied.
+        
+        Runs a single ``pip install --dry-run --report -`` (pip >= 22.2) so
+        version specifiers are resolved by pip itself instead of treating any
+        installed version as good enough.
+        
+        Args:
+            requirements: Requirement strings to check
+            
+        Returns:
+            Canonical names of the distributions pip would install, or None if
+            the dry run isn't available or failed
+        """
+        resolved = self._pip_resolve(requirements)
+        if resolved is None:
+            return None
+        return {_canonicalize_name(_SPEC_RE.split(pin, 1)[0]) for pin in resolved}
+    
+    def _pip_resolve(self, requirements: List[str], upgrade: bool = False) -> Optional[List[str]]:
+        """
+        Resolve the distributions pip would install for the given requirements.
+        
+        Runs a single ``pip install --dry-run --report -`` (pip >= 22.2).
+        
+        Args:
+            requirements: Requirement strings to resolve
+            upgrade: Whether to resolve as for ``pip install --upgrade``
+            
+        Returns:
+            Pinned ``name==version`` requirements for every distribution pip would
+            install (including dependencies), or None if the dry run isn't
+            available or failed
+        """
+        cmd = list(_PIP_CMD) + ["install", "--dry-run", "--quiet", "--report", "-"]
+        if upgrade:
+            cmd.append("--upgrade")
+        cmd.extend(requirements)
+        try:
+            process = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            if process.returncode != 0:
+                self.logger.debug("pip dry run failed: %s", process.stderr)
+                return None
+            report = json.loads(process.stdout)
+            return [
+                f"{item['metadata']['name']}=={item['metadata']['version']}"
+                for item in report.get("install", [])
+            ]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug("Could not read pip dry run report: %s", e)
+            return None
     
     def get_schema(self) -> Dict[str, Any]:
         """Get a schema describing the tool's parameters."""
@@ -144,21 +420,8 @@ class PackageInstallerTool(Tool):
             Dictionary mapping error patterns to handler information
         """
         def module_not_found_arg_generator(error_message: str, failed_step: Dict[str, Any]) -> Dict[str, Any]:
-            # Try to extract module name using regex for different patterns
-            module_name = None
-
-            # Pattern 1: "No module named 'module_name'" / "No module named \"module_name\""
-            match1 = re.search(r"No module named ['\"]([^'\"]+)['\"]", error_message)
-            if match1:
-                module_name = match1.group(1)
-
-            # Pattern 2: "Missing optional dependency 'module_name'" / "... \"module_name\""
-            match2 = re.search(r"Missing optional dependency ['\"]([^'\"]+)['\"]", error_message)
-            if not module_name and match2: # Only use if pattern 1 didn't match
-                module_name = match2.group(1)
-                # Add more specific package name mappings here if needed (e.g., some libs have different import vs pip names)
-                # Example: if module_name == 'PIL': module_name = 'Pillow'
-                # For tabulate, the import name and pip name are the same.
+            # Try to extract module name using the precompiled patterns
+            module_name = _extract_missing_module(error_message)
 
             if module_name:
                 self.logger.info(f"Extracted module '{module_name}' for installation from error.")
@@ -200,13 +463,7 @@ def check_module_installed(module_name: str) -> bool:
     Returns:
         True if the module is installed, False otherwise
     """
-    try:
-        importlib.import_module(module_name)
+    if _has_module(module_name):
         return True
-    except ImportError:
-        # Some packages have different import names than their PyPI names
-        try:
-            pkg_resources.get_distribution(module_name)
-            return True
-        except pkg_resources.DistributionNotFound:
-            return False
\ No newline at end of file
+    # Some packages have different import names than their PyPI names
+    return _canonicalize_name(module_name) in _installed_dists()
\ No newline at end of file
@@ -5,14 +5,72 @@ This module provides a tool that allows agents to fetch and extract content
 from web pages.
 """
 
+import html
+import re
+import threading
 import requests
-from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from .base import Tool, ToolResult
-from html2text import HTML2Text
 from urllib.parse import urlparse
 from catalyst_agent.event_queue import EventQueue
 
+try:
+    import lxml  # noqa: F401 - only needed as BeautifulSoup's C parser backend
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# bs4 and html2text are imported where they are first used, so importing the
+# tools package doesn't pay for them unless a page is actually fetched
+if TYPE_CHECKING:
+    from html2text import HTML2Text
+
+# Raw-byte scanners for the page title and meta description, used to answer
+# summary requests without building a parse tree
+_TITLE_RE = re.compile(rb"<title(?:\s[^>]*)?>(.*?)</title\s*>", re.I | re.S)
+_META_DESC_RE = re.compile(
+    rb"""<meta\s[^>]*?name\s*=\s*(["']?)description\1(?=[\s/>])[^>]*?\scontent\s*=\s*(["'])(.*?)\2""",
+    re.I | re.S)
+
+# Minimum meta description length that is used as a summary on its own
+_MIN_SUMMARY_LENGTH = 100
+
+# Maximum length of a summary built from the page's paragraphs
+_MAX_SUMMARY_LENGTH = 500
+
+# Elements removed before extraction (ads, navigation, etc.), by tag name or class
+_STRIP_TAGS = frozenset(("script", "style", "nav", "footer"))
+_STRIP_CLASSES = frozenset(("ad", "advertisement", "nav", "menu", "sidebar"))
+
+
+def _is_unwanted(tag) -> bool:
+    """Match elements that should be stripped from a page before extraction."""
+    if tag.name in _STRIP_TAGS:
+        return True
+    classes = tag.get("class")
+    return bool(classes) and not _STRIP_CLASSES.isdisjoint(classes)
+
+
+# One configured HTML2Text converter per thread, shared by all tool instances.
+# A converter keeps per-document state, so threads can't share a single one.
+_html_converters = threading.local()
+
+
+def _get_html_converter() -> "HTML2Text":
+    """Return this thread's HTML to markdown converter, creating it on first use."""
+    converter = getattr(_html_converters, 'converter', None)
+    if converter is None:
+        from html2text import HTML2Text
+        converter = HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = True
+        converter.ignore_tables = False
+        converter.body_width = 0  # No wrapping
+        _html_converters.converter = converter
+    return converter
+
 class WebFetchTool(Tool):
     """
     Tool for fetching and extracting text content from web pages.
@@ -28,6 +86,8 @@ class WebFetchTool(Tool):
                  description: str = "Fetch text content from a web page URL. Do not use this tool to fetch binary content like images. ",
                  max_content_length: int = 10000,
                  user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                 cache_size: int = 128,
+                 max_download_bytes: int = 2 * 1024 * 1024,
                  event_queue: Optional[EventQueue] = None):
         """
         Initialize the web fetch tool.
@@ -37,15 +97,20 @@ class WebFetchTool(Tool):
             description: Description of what the tool does
             max_content_length: Maximum length of content to return (in characters)
             user_agent: User agent string to use for requests
+            cache_size: Maximum number of fetched pages kept for conditional re-fetching (0 disables caching)
+            max_download_bytes: Maximum number of bytes of a page that are downloaded and parsed
         """
         super().__init__(name, description, event_queue=event_queue)
         self.max_content_length = max_content_length
         self.user_agent = user_agent
-        self.html_converter = HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
-        self.html_converter.ignore_tables = False
-        self.html_converter.body_width = 0  # No wrapping
+        self.max_download_bytes = max_download_bytes
+        # Reuse connections (and TLS sessions) across fetches
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        # (url, extract_type) -> (etag, last_modified, result data), in LRU order
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Optional[str], Optional[str], Dict[str, Any]]]" = OrderedDict()
+        self._cache_max = cache_size
+        self._cache_lock = threading.Lock()
 
     def execute(self, url: str, extract_type: str = "full") -> ToolResult:
         """
@@ -67,41 +132,72 @@ class WebFetchTool(Tool):
             if not parsed_url.scheme or not parsed_url.netloc:
                 return ToolResult.error_result(f"Invalid URL: {url}")
                 
-            # Fetch the web page
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()  # Raise exception for 4XX/5XX status codes
-            
-            # Check content type to ensure we're only processing HTML/text content
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'text/html' not in content_type and 'text/plain' not in content_type:
-                return ToolResult.error_result(
-                    f"This tool only processes HTML or text content. Received content type: {content_type}. "
-                    f"Binary content like images cannot be processed by this tool."
-                )
-            
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Remove unwanted elements (ads, navigation, etc.)
-            for element in soup.select("script, style, nav, footer, .ad, .advertisement, .nav, .menu, .sidebar"):
-                element.decompose()
+            # Fetch the web page, revalidating a cached copy if we have one
+            cache_key = (url, extract_type)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            headers = {}
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            response = self.session.get(url, headers=headers, timeout=10, stream=True)
+            try:
+                if cached is not None and response.status_code == 304:
+                    with self._cache_lock:
+                        if cache_key in self._cache:
+                            self._cache.move_to_end(cache_key)
+                    return ToolResult.success_result(dict(cached[2]))
+                response.raise_for_status()  # Raise exception for 4XX/5XX status codes
+                
+                # Check content type to ensure we're only processing HTML/text content
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'text/html' not in content_type and 'text/plain' not in content_type:
+                    return ToolResult.error_result(
+                        f"This tool only processes HTML or text content. Received content type: {content_type}. "
+                        f"Binary content like images cannot be processed by this tool."
+                    )
+                
+                body = self._read_body(response)
+            finally:
+                # Stop the download (and return the connection) once we have what we need
+                response.close()
             
+            encoding = response.encoding if 'charset=' in content_type else None
             result_data = {}
             result_data["url"] = url
-            result_data["title"] = soup.title.text.strip() if soup.title else ""
             
-            # Extract content based on the requested type
-            if extract_type == "main":
-                # Try to extract main content by finding the largest text block
-                main_content = self._extract_main_content(soup)
-                content = self.html_converter.handle(str(main_content))
-            elif extract_type == "summary":
-                # Extract a summary of the content
-                content = self._extract_summary(soup)
-            else:  # "full" content
-                # Convert the entire cleaned HTML to text
-                content = self.html_converter.handle(str(soup))
+            # A summary usually only needs the title and meta description, which
+            # can be read from the raw bytes without parsing the whole page
+            prescanned = self._prescan_summary(body, encoding) if extract_type == "summary" else None
+            if prescanned is not None:
+                result_data["title"], content = prescanned
+            else:
+                from bs4 import BeautifulSoup
+                
+                # Parse the HTML content (raw bytes, so the parser decodes them once itself)
+                soup = BeautifulSoup(body, _HTML_PARSER, from_encoding=encoding)
+                
+                # Remove unwanted elements (ads, navigation, etc.)
+                # (one tree walk with a plain predicate instead of a multi-part CSS selector)
+                for element in soup.find_all(_is_unwanted):
+                    element.decompose()
+                
+                result_data["title"] = soup.title.text.strip() if soup.title else ""
+                
+                # Extract content based on the requested type
+                if extract_type == "main":
+                    # Try to extract main content by finding the largest text block
+                    main_content = self._extract_main_content(soup)
+                    content = self._to_markdown(str(main_content))
+                elif extract_type == "summary":
+                    # Extract a summary of the content
+                    content = self._extract_summary(soup)
+                else:  # "full" content
+                    # Convert the entire cleaned HTML to text
+                    content = self._to_markdown(str(soup))
             
             # Truncate content if it's too long
             if len(content) > self.max_content_length:
@@ -111,12 +207,108 @@ class WebFetchTool(Tool):
             result_data["content_type"] = extract_type
             result_data["length"] = len(content)
             
+            self._cache_result(cache_key, response, result_data)
             return ToolResult.success_result(result_data)
         except requests.exceptions.RequestException as e:
             return ToolResult.error_result(f"Error fetching URL: {str(e)}")
         except Exception as e:
             return ToolResult.error_result(f"Error processing web content: {str(e)}")
 
+    def _read_body(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed response body, stopping at ``max_download_bytes``.
+        
+        Only ``max_content_length`` characters are returned to the agent, so
+        the rest of a very large page is never downloaded or parsed.
+        
+        Args:
+            response: Response opened with ``stream=True``
+            
+        Returns:
+            The (possibly truncated) body
+        """
+        cap = self.max_download_bytes
+        buf = bytearray()
+        for chunk in response.iter_content(65536):
+            buf += chunk
+            if len(buf) >= cap:
+                del buf[cap:]
+                break
+        return bytes(buf)
+
+    def _cache_result(self, cache_key: Tuple[str, str], response: requests.Response,
+                      result_data: Dict[str, Any]) -> None:
+        """Remember a fetch result if the server provided validators for a conditional re-fetch."""
+        if self._cache_max <= 0:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # Without validators the page can't be revalidated, so don't keep it
+            with self._cache_lock:
+                self._cache.pop(cache_key, None)
+            return
+        with self._cache_lock:
+            self._cache[cache_key] = (etag, last_modified, dict(result_data))
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
+    def execute_many(self, urls: List[str], extract_type: str = "full",
+                     concurrency: int = 8) -> List[ToolResult]:
+        """
+        Fetch several web pages concurrently.
+        
+        Pages are downloaded in parallel on a thread pool (sharing the tool's
+        pooled session), so fetching N pages takes roughly as long as the
+        slowest one rather than the sum of all of them.
+        
+        Args:
+            urls: The URLs to fetch content from
+            extract_type: The type of content to extract (full, main, summary)
+            concurrency: Maximum number of pages fetched at the same time
+            
+        Returns:
+            One result per URL, in the same order as ``urls``
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls)))) as executor:
+            return list(executor.map(lambda url: self.execute(url, extract_type), urls))
+
+    @staticmethod
+    def _prescan_summary(body: bytes, encoding: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Find the title and meta description of a page with a regex scan of its raw bytes.
+        
+        Args:
+            body: Raw page body
+            encoding: Charset declared by the server, if any (UTF-8 is assumed otherwise)
+            
+        Returns:
+            (title, summary), or None if either is missing or the description is too
+            short to be used as a summary, in which case the page has to be parsed
+        """
+        title_match = _TITLE_RE.search(body)
+        if title_match is None:
+            return None
+        desc_match = _META_DESC_RE.search(body)
+        if desc_match is None:
+            return None
+        try:
+            title = title_match.group(1).decode(encoding or "utf-8")
+            description = desc_match.group(3).decode(encoding or "utf-8")
+        except (LookupError, UnicodeDecodeError):
+            return None
+        description = html.unescape(description)
+        if len(description) < _MIN_SUMMARY_LENGTH:
+            return None
+        return html.unescape(title).strip(), description
+
+    def _to_markdown(self, html: str) -> str:
+        """Convert HTML to markdown with this thread's shared converter."""
+        return _get_html_converter().handle(html)
+
     def _extract_main_content(self, soup):
         """Extract the main content of a web page."""
         # Look for common content containers
@@ -128,16 +320,19 @@ class WebFetchTool(Tool):
         # If no common container found, find the element with the most text
         paragraphs = soup.find_all('p')
         if paragraphs:
-            # Find the div that contains the most paragraphs
+            # Find the div that directly holds the most paragraphs. Only the nearest div
+            # ancestor of each paragraph is counted, and divs are keyed by id() since
+            # BeautifulSoup tags hash/compare by their whole subtree.
             div_paragraph_counts = {}
             for p in paragraphs:
-                parents = list(p.parents)
-                for parent in parents:
+                for parent in p.parents:
                     if parent.name == 'div':
-                        div_paragraph_counts[parent] = div_paragraph_counts.get(parent, 0) + 1
+                        count, _ = div_paragraph_counts.get(id(parent), (0, parent))
+                        div_paragraph_counts[id(parent)] = (count + 1, parent)
+                        break
             
             if div_paragraph_counts:
-                main_div = max(div_paragraph_counts.items(), key=lambda x: x[1])[0]
+                main_div = max(div_paragraph_counts.values(), key=lambda x: x[0])[1]
                 return main_div
         
         # Fall back to body if no better container found
@@ -150,10 +345,23 @@ class WebFetchTool(Tool):
         summary = meta_desc['content'] if meta_desc and 'content' in meta_desc.attrs else ""
         
         # If no meta description or it's too short, extract first few paragraphs
-        if len(summary) < 100:
-            paragraphs = soup.find_all('p')
-            content = "\n\n".join([p.get_text(strip=True) for p in paragraphs[:5]])
-            summary = content[:500] + "..." if len(content) > 500 else content
+        if len(summary) < _MIN_SUMMARY_LENGTH:
+            # Walk the paragraphs lazily and stop as soon as enough text is collected,
+            # rather than extracting the text of every paragraph in the page
+            texts = []
+            total = 0
+            for element in soup.descendants:
+                if element.name != 'p':
+                    continue
+                text = element.get_text(" ", strip=True)
+                if not text:
+                    continue
+                texts.append(text)
+                total += len(text) + 2
+                if total > _MAX_SUMMARY_LENGTH or len(texts) >= 5:
+                    break
+            content = "\n\n".join(texts)
+            summary = content[:_MAX_SUMMARY_LENGTH] + "..." if len(content) > _MAX_SUMMARY_LENGTH else content
         
         return summary
 
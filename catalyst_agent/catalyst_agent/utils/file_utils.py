@@ -6,8 +6,14 @@ This module provides utility functions for working with files and directories.
 
 import os
 import json
+import uuid
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
+
+
+# Absolute paths of directories save_json_file already created, so repeated writes
+# to the same directory skip makedirs (set.add is atomic under the GIL)
+_known_dirs: Set[str] = set()
 
 
 def load_json_file(path: str) -> Dict[str, Any]:
@@ -21,33 +27,66 @@ def load_json_file(path: str) -> Dict[str, Any]:
         Dictionary containing the JSON data
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # One binary read straight into bytes; json.loads decodes UTF-8 itself,
+        # skipping the text layer's incremental decoding into a second buffer
+        with open(path, 'rb') as f:
+            return json.loads(f.read())
     except Exception as e:
         logger = logging.getLogger('agentic.utils')
         logger.error(f"Error loading JSON file {path}: {str(e)}")
         return {}
 
 
-def save_json_file(data: Union[Dict[str, Any], List[Any]], path: str) -> bool:
+def save_json_file(data: Union[Dict[str, Any], List[Any]], path: str, durable: bool = True) -> bool:
     """
     Save data to a JSON file.
     
+    The data is written to a temporary file in the same directory which then
+    atomically replaces the target, so readers never see a partially written
+    file even if the process crashes mid-write.
+    
     Args:
         data: Data to save
         path: Path where to save the JSON file
+        durable: Whether to fsync the data before replacing the target. Pass
+            False for ephemeral files where crash durability doesn't matter.
         
     Returns:
         True if successful, False otherwise
     """
+    tmp_path = None
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        dir_path = os.path.dirname(os.path.abspath(path))
+        if dir_path not in _known_dirs:
+            ensure_directory_exists(dir_path)
+            _known_dirs.add(dir_path)
+        
+        # Serialize up front and write once: json.dump would issue a write per token chunk
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+        except FileNotFoundError:
+            # The directory was removed since it was cached, create it again
+            ensure_directory_exists(dir_path)
+            fd = os.open(tmp_path, flags, 0o666)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        tmp_path = None
         return True
     except Exception as e:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
         logger = logging.getLogger('agentic.utils')
         logger.error(f"Error saving JSON file {path}: {str(e)}")
         return False
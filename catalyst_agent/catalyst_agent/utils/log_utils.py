@@ -4,14 +4,35 @@ Logging and text utilities for the Agentic Core.
 This module provides utility functions for logging and text processing.
 """
 
+import functools
 import logging
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=None)
+def _configure_logger(name: str) -> logging.Logger:
+    """Attach the console handler to a logger (once per name)."""
+    logger = logging.getLogger(name)
+    
+    # Disable propagation to parent loggers to prevent duplicate logs
+    logger.propagate = False
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    return logger
+
+
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Set up a logger with the specified name and level.
     
+    The handler setup is cached per name, so repeated calls (e.g. from tools
+    created in a loop) only update the level.
+    
     Args:
         name: Name of the logger
         level: Logging level
@@ -19,18 +40,8 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
+    logger = _configure_logger(name)
     logger.setLevel(level)
-    
-    # Disable propagation to parent loggers to prevent duplicate logs
-    logger.propagate = False
-    
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    
     return logger
 
 
@@ -45,6 +56,4 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     Returns:
         Truncated text
     """
-    if len(text) <= max_length:
-        return text
-    return text[:max_length - 3] + "..."
\ No newline at end of file
+    return text if len(text) <= max_length else f"{text[:max_length - 3]}..."
\ No newline at end of file
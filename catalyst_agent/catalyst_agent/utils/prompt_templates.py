@@ -1,6 +1,18 @@
 """ Inline prompt templates for the agent. """
 
+import functools
+from string import Formatter
+from typing import Any, Callable
+
+
+def _escape_braces(text: str) -> str:
+    """ Escape literal braces so text can be embedded in a str.format template. """
+    return text.replace("{", "{{").replace("}", "}}")
+
 ###
+# Everything except the trailing "Runtime Context" block is identical across calls.
+# The per-call values are kept at the very end so LLM providers can reuse their
+# cached prefix of the system prompt instead of re-processing it every turn.
 SYSTEM_DIRECTIVES = """
 Only tools when necessary. Many tasks can be accomplished directly through your language capabilities. For example:
 - Use tools for: calculations, file operations, code execution, data processing, web searches for current information
@@ -11,14 +23,15 @@ When using tools, you MUST use the EXACT parameter names as specified in the too
 Do not invent or rename parameters. For example, if a tool requires parameters named 'a' and 'b',
 do not use 'operand1' or 'operand2' or any other names.
 
-Today's date is {current_date}. When processing queries about any other time-relative 
+Today's date is given in the Runtime Context below. When processing queries about any other time-relative 
 terms use this information as your reference point. Consider this before taking on tasks requiring
 information after your data cutoff date.
 
 IMPORTANT: Your final output will be in markdown format to be render on a website. Images should either 
 be a link to a URL. Files should be links to URLs. When saving files to local filesystem, save it in the
-directory {storage_path} and return as a markdown link [<file_name>]('http://localhost:5000/blob/<file_name>') 
-where <file_name> is the actual name of the file. Note that the URL is "blob" not "{storage_path}".
+storage directory given in the Runtime Context below and return as a markdown link 
+[<file_name>]('http://localhost:5000/blob/<file_name>') where <file_name> is the actual name of the file. 
+Note that the URL is "blob", not the storage directory.
 
 EXAMPLE output for an answer with a file:
 Here are the results of my analysis. You can download the file [here](http://localhost:5000/blob_storage/results.txt).
@@ -37,31 +50,15 @@ EXAMPLE block formulas:
 $$E=mc^2$$
 """
 
-SYSTEM_GENERATE = f"""
-You are an Agentic AI that can break down tasks into specific steps.
-Your job is to analyze a goal and create a plan to accomplish it using available tools.
-Each step should be clear, specific, and actionable.
-
-{SYSTEM_DIRECTIVES}
+SYSTEM_RUNTIME_CONTEXT = """
+## Runtime Context
+Today's date: {current_date}
+Storage directory for saved files: {storage_path}
 """
 
 ###
-SYSTEM_REPLAN = f"""
-You are an Agentic AI that can analyze execution results and adapt plans accordingly.
-Your job is to evaluate the results of the last executed step and determine if the current plan needs adjustment.
-You can:
-1. Keep the remaining steps as they are if they're still appropriate
-2. Modify steps if needed based on new information
-3. Add new steps if necessary to achieve the goal
-4. Remove steps that are no longer needed
-5. Fill in placeholders with actual values if applicable
-
-Your response MUST be a valid JSON object containing the evaluation and any updated plan.
-
-{SYSTEM_DIRECTIVES}
-"""
-
-### 
+# Output format and examples for planning. Part of the static system prompt prefix
+# (not the per-call user message) so providers can cache it along with the directives.
 TOOLS_FEW_SHOT_EXAMPLES = """
 FORMAT YOUR RESPONSE AS JSON:
 {
@@ -101,6 +98,32 @@ EXAMPLE for tasks NOT requiring a tool:
 }
 """
 
+SYSTEM_GENERATE = f"""
+You are an Agentic AI that can break down tasks into specific steps.
+Your job is to analyze a goal and create a plan to accomplish it using available tools.
+Each step should be clear, specific, and actionable.
+
+{SYSTEM_DIRECTIVES}
+{_escape_braces(TOOLS_FEW_SHOT_EXAMPLES)}
+{SYSTEM_RUNTIME_CONTEXT}"""
+
+###
+SYSTEM_REPLAN = f"""
+You are an Agentic AI that can analyze execution results and adapt plans accordingly.
+Your job is to evaluate the results of the last executed step and determine if the current plan needs adjustment.
+You can:
+1. Keep the remaining steps as they are if they're still appropriate
+2. Modify steps if needed based on new information
+3. Add new steps if necessary to achieve the goal
+4. Remove steps that are no longer needed
+5. Fill in placeholders with actual values if applicable
+
+Your response MUST be a valid JSON object containing the evaluation and any updated plan.
+
+{SYSTEM_DIRECTIVES}
+{SYSTEM_RUNTIME_CONTEXT}"""
+
+
 ###
 USER_PLAN ="""
 GOAL: {goal}
@@ -118,13 +141,15 @@ If tools are needed, break down this goal into a series of steps. For each step,
 1. A clear description of what needs to be done
 2. Which tool (if any) should be used for this step
 3. What arguments should be passed to the tool using EXACTLY the parameter names specified in the tool schema
-
-{few_shot_examples}
 """
 
-
-
-
+SYSTEM_SUMMARIZE_HISTORY = """
+You are summarizing the earlier part of a conversation between a user and an AI agent
+so that it can be continued with a shorter context.
+Write a concise, high-level summary of what the user asked for and what the agent did.
+Keep every fact that later turns may depend on: decisions, results, numbers, file names and URLs.
+Leave out greetings, repetition and intermediate reasoning. Respond with the summary only.
+"""
 
 USER_GENERATE = """
     USER MESSAGE: {message}
@@ -157,4 +182,75 @@ directly through language generation. Don't use tools unnecessarily.
 
 If adjustments are needed, provide an updated plan. Otherwise, confirm the current plan is still valid.
 
-"""
\ No newline at end of file
+"""
+
+
+###
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-split a str.format template into literal segments and field names.
+
+    The template is parsed once at import time; rendering just joins the cached
+    segments with the given values, so large templates aren't re-parsed by
+    str.format on every agent turn.
+
+    Args:
+        template: Template using plain {name} fields (no format specs or conversions)
+
+    Returns:
+        Function rendering the template from keyword arguments
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if literal:
+            parts.append((literal, None))
+        if field is not None:
+            if spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{field}}}")
+            parts.append((None, field))
+    parts = tuple(parts)
+
+    def render(**values: Any) -> str:
+        return "".join(literal if field is None else str(values[field]) for literal, field in parts)
+
+    return render
+
+
+_render_system_generate = _compile_template(SYSTEM_GENERATE)
+_render_system_replan = _compile_template(SYSTEM_REPLAN)
+_render_user_plan = _compile_template(USER_PLAN)
+_render_user_generate = _compile_template(USER_GENERATE)
+_render_user_replan = _compile_template(USER_REPLAN)
+
+
+@functools.lru_cache(maxsize=32)
+def render_system_generate(current_date: str, storage_path: str) -> str:
+    """ Render SYSTEM_GENERATE (cached, since it only changes with the date and storage path). """
+    return _render_system_generate(current_date=current_date, storage_path=storage_path)
+
+
+@functools.lru_cache(maxsize=32)
+def render_system_replan(current_date: str, storage_path: str) -> str:
+    """ Render SYSTEM_REPLAN (cached, since it only changes with the date and storage path). """
+    return _render_system_replan(current_date=current_date, storage_path=storage_path)
+
+
+def render_user_plan(goal: str, tool_descriptions: str, conversation_history: str) -> str:
+    """ Render USER_PLAN (the few-shot examples are part of SYSTEM_GENERATE). """
+    return _render_user_plan(goal=goal, tool_descriptions=tool_descriptions,
+                             conversation_history=conversation_history)
+
+
+def render_user_generate(message: str, conversation_history: str) -> str:
+    """ Render USER_GENERATE. """
+    return _render_user_generate(message=message, conversation_history=conversation_history)
+
+
+def render_user_replan(goal: str, tool_descriptions: str, executed_steps_str: str,
+                       last_step_result: Any, remaining_steps_str: str, reasoning: str) -> str:
+    """ Render USER_REPLAN. """
+    return _render_user_replan(goal=goal, tool_descriptions=tool_descriptions,
+                               executed_steps_str=executed_steps_str,
+                               last_step_result=last_step_result,
+                               remaining_steps_str=remaining_steps_str,
+                               reasoning=reasoning)
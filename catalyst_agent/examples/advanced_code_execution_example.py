@@ -13,6 +13,7 @@ import os
 import sys
 import json
 import time
+from collections import ChainMap
 from pathlib import Path
 from pprint import pprint
 from dotenv import load_dotenv
@@ -40,48 +41,42 @@ class CodeExecutionDebugger:
     
     def print_plan(self, plan):
         """Print the plan in a readable format"""
-        print("\n=== PLAN ===")
-        print(f"Goal: {plan.goal}")
-        print(f"Status: {plan.status.name}")
+        # Collect the report and write it in one go rather than a print() per line
+        lines = ["\n=== PLAN ===", f"Goal: {plan.goal}", f"Status: {plan.status.name}"]
         
-        for i, step in enumerate(plan.steps):
-            print(f"\nStep {i+1}: {step.description}")
-            print(f"  Tool: {step.tool_name or 'None'}")
+        for i, step in enumerate(plan.steps, 1):
+            lines.append(f"\nStep {i}: {step.description}")
+            lines.append(f"  Tool: {step.tool_name or 'None'}")
             if step.tool_args:
-                print(f"  Args: {json.dumps(step.tool_args, indent=2)}")
-            print(f"  Status: {step.status.name}")
+                lines.append(f"  Args: {json.dumps(step.tool_args, indent=2)}")
+            lines.append(f"  Status: {step.status.name}")
             
             if step.result:
-                print(f"  Result: {type(step.result).__name__}")
+                lines.append(f"  Result: {type(step.result).__name__}")
                 if isinstance(step.result, dict) and "stdout" in step.result:
-                    print("  --- Output ---")
-                    print(step.result.get("stdout", ""))
+                    lines.append("  --- Output ---")
+                    lines.append(step.result.get("stdout", ""))
                     if step.result.get("stderr"):
-                        print("  --- Errors ---")
-                        print(step.result.get("stderr", ""))
+                        lines.append("  --- Errors ---")
+                        lines.append(step.result.get("stderr", ""))
             
             if step.error:
-                print(f"  Error: {step.error}")
-        print("=== END PLAN ===\n")
+                lines.append(f"  Error: {step.error}")
+        lines.append("=== END PLAN ===\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def intercept_plan(self):
-        """Monkey patch the planning engine to intercept plans"""
-        original_create_plan = self.agent.planning_engine.create_plan
-        original_execute_plan = self.agent.planning_engine.execute_plan
-        
-        def create_plan_wrapper(*args, **kwargs):
-            plan = original_create_plan(*args, **kwargs)
-            self.last_plan = plan
-            print("Plan created!")
-            return plan
-        
-        def execute_plan_wrapper(plan, *args, **kwargs):
-            result = original_execute_plan(plan, *args, **kwargs)
-            self.print_plan(plan)
-            return result
-        
-        self.agent.planning_engine.create_plan = create_plan_wrapper
-        self.agent.planning_engine.execute_plan = execute_plan_wrapper
+        """Register with the planning engine to be notified of created and executed plans"""
+        engine = self.agent.planning_engine
+        engine.plan_created_callbacks.append(self._on_plan_created)
+        engine.plan_executed_callbacks.append(self._on_plan_executed)
+    
+    def _on_plan_created(self, plan):
+        self.last_plan = plan
+        print("Plan created!")
+    
+    def _on_plan_executed(self, plan, success):
+        self.print_plan(plan)
 
 
 def provide_data_context():
@@ -143,7 +138,10 @@ def main():
     # First, let's directly use the tool to demonstrate how it works
     print("\n=== Direct tool execution (bypassing the agent) ===")
     code_to_run = """
-import matplotlib.pyplot as plt
+# Use the Agg canvas directly instead of pyplot: no GUI backend, and no global
+# figure manager state to set up and tear down on every call
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import json
 
 # Access the sales data provided in the context
@@ -158,17 +156,17 @@ total_sales = sum(amounts)
 avg_sales = total_sales / len(amounts)
 
 # Create a bar chart
-plt.figure(figsize=(8, 5))
-bars = plt.bar(quarters, amounts, color='skyblue')
-plt.axhline(y=avg_sales, color='red', linestyle='--', label=f'Average: ${avg_sales:.2f}')
-plt.xlabel('Quarter')
-plt.ylabel('Sales Amount ($)')
-plt.title('Quarterly Sales Performance')
-plt.legend()
+fig = Figure(figsize=(8, 5))
+ax = fig.subplots()
+bars = ax.bar(quarters, amounts, color='skyblue')
+ax.axhline(y=avg_sales, color='red', linestyle='--', label=f'Average: ${avg_sales:.2f}')
+ax.set_xlabel('Quarter')
+ax.set_ylabel('Sales Amount ($)')
+ax.set_title('Quarterly Sales Performance')
+ax.legend()
 
 # Save the chart to a file instead of displaying it
-plt.savefig('sales_chart.png')
-plt.close()
+FigureCanvasAgg(fig).print_png('sales_chart.png')
 
 # Print analysis
 print(f"Total sales: ${total_sales}")
@@ -204,10 +202,9 @@ return {
     original_execute = code_execution_tool.execute
     
     def execute_with_context(code, variables=None):
-        # Merge variables with our data context
-        merged_vars = data_context.copy()
-        if variables:
-            merged_vars.update(variables)
+        # Layer the step's variables over our data context without copying it
+        # (lookups check variables first; data_context itself is never modified)
+        merged_vars = ChainMap(variables or {}, data_context)
         return original_execute(code, merged_vars)
     
     # Replace the execution method temporarily
@@ -1,5 +1,6 @@
 import sys
 import os
+import importlib
 import textwrap
 from pathlib import Path
 from dotenv import load_dotenv
@@ -12,16 +13,32 @@ parent_dir = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(parent_dir))
 
 from catalyst_agent import AgentCore, AgentConfig
-from catalyst_agent.tools.code_execution import DynamicCodeExecutionTool
-from catalyst_agent.tools.web_search import WebSearchTool
-from catalyst_agent.tools.web_fetch import WebFetchTool
-from catalyst_agent.tools.image_generation import ImageGenerationTool
-from catalyst_agent.tools.package_manager import PackageInstallerTool
-from catalyst_agent.tools.download_file import DownloadFileTool
+
+# Tool classes by tool name. Tool modules are only imported when the tool is
+# actually used, so the dependencies of unused tools are never loaded.
+TOOL_REGISTRY = {
+    "execute_python": "catalyst_agent.tools.code_execution:DynamicCodeExecutionTool",
+    "web_search": "catalyst_agent.tools.web_search:WebSearchTool",
+    "web_fetch_text_only": "catalyst_agent.tools.web_fetch:WebFetchTool",
+    "generate_image": "catalyst_agent.tools.image_generation:ImageGenerationTool",
+    "package_installer": "catalyst_agent.tools.package_manager:PackageInstallerTool",
+    "download_file": "catalyst_agent.tools.download_file:DownloadFileTool",
+}
+
+
+def load_tool(name, **kwargs):
+    """Import and instantiate a tool from TOOL_REGISTRY."""
+    module_name, class_name = TOOL_REGISTRY[name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)(**kwargs)
+
 
 if __name__ == "__main__":
     # Initialize the agent with a configuration
-    config = AgentConfig(blob_storage_path='./output', tool_discovery_enabled=False)
+    config = AgentConfig(
+        blob_storage_path='./output',
+        tool_discovery_enabled=False,
+        available_tools=["execute_python", "package_installer", "web_search", "download_file"]
+    )
     
     # Add current date to config metadata to help with temporal understanding
     current_date = datetime.now().strftime("%Y-%m-%d")
@@ -36,43 +53,36 @@ if __name__ == "__main__":
     # Create an instance of the agent
     agent = AgentCore(config)
     
-    # Initialize the code execution tool
-    code_execution_tool = DynamicCodeExecutionTool()
-
-    # Create the web search tool configured for Google
-    web_search_tool = WebSearchTool(
-        search_engine="google",
-        api_key=os.environ.get('GOOGLE_API_KEY', 'YOUR_GOOGLE_API_KEY'),
-        cx_id=os.environ.get('GOOGLE_CX_ID', 'YOUR_GOOGLE_CX_ID'),
-        max_results=5,
-        include_snippets=True
-    )
-    
-    # Initialize the web fetch tool to retrieve content from web pages
-    web_fetch_tool = WebFetchTool(
-        max_content_length=8000  # Limit content length to avoid overwhelming the agent
-    )
-
-    # Initialize the image generation tool with Azure OpenAI DALL-E API credentials
-    image_tool = ImageGenerationTool(
-        api_key=os.environ.get("AZURE_OPENAI_DALLE_KEY"),
-        endpoint=os.environ.get("AZURE_OPENAI_DALLE_ENDPOINT"),
-        size="1024x1024",  # Options: 1024x1024, 1792x1024, 1024x1792
-        quality="standard",  # Options: standard, hd
-        save_directory='./generated_images'  # Directory to save generated images
-    )
-
-    download_tool = DownloadFileTool(
-        default_output_dir='./blob_storage',  # Directory to save downloaded files
-    )
-
-    python_package_installer_tool = PackageInstallerTool()    
+    # Constructor arguments for tools that need configuration
+    tool_args = {
+        # Web search configured for Google
+        "web_search": dict(
+            search_engine="google",
+            api_key=os.environ.get('GOOGLE_API_KEY', 'YOUR_GOOGLE_API_KEY'),
+            cx_id=os.environ.get('GOOGLE_CX_ID', 'YOUR_GOOGLE_CX_ID'),
+            max_results=5,
+            include_snippets=True
+        ),
+        # Web fetch to retrieve content from web pages
+        "web_fetch_text_only": dict(
+            max_content_length=8000  # Limit content length to avoid overwhelming the agent
+        ),
+        # Image generation with Azure OpenAI DALL-E API credentials
+        "generate_image": dict(
+            api_key=os.environ.get("AZURE_OPENAI_DALLE_KEY"),
+            endpoint=os.environ.get("AZURE_OPENAI_DALLE_ENDPOINT"),
+            size="1024x1024",  # Options: 1024x1024, 1792x1024, 1024x1792
+            quality="standard",  # Options: standard, hd
+            save_directory='./generated_images'  # Directory to save generated images
+        ),
+        "download_file": dict(
+            default_output_dir='./blob_storage',  # Directory to save downloaded files
+        ),
+    }
     
-    # Register the tools with the agent
-    agent.register_tool(code_execution_tool)
-    agent.register_tool(python_package_installer_tool)
-    agent.register_tool(web_search_tool)
-    agent.register_tool(download_tool)
+    # Load and register only the tools the agent is configured to use
+    for tool_name in config.available_tools:
+        agent.register_tool(load_tool(tool_name, **tool_args.get(tool_name, {})))
 
 
     # # Example of a task that requires a tool (code execution)
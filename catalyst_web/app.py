@@ -13,9 +13,15 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from flask import Flask, render_template, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the parent directory to sys.path to make core module imports work
 parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
@@ -23,11 +29,37 @@ sys.path.append(str(parent_dir))
 # Load environment variables
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses with orjson instead of the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs):
+        # Dates and dataclasses go through Flask's default() so the output matches
+        # the stdlib provider; anything orjson can't handle falls back to it entirely
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+
 # Create Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for all routes
 app.secret_key = os.environ.get('SECRET_KEY', 'catalyst-dev-key-change-in-production')
 app.config['JSON_SORT_KEYS'] = False
+# Let a fronting web server (nginx/Apache with X-Sendfile support) send blob files
+# straight from disk instead of streaming them through Python. Only enable this
+# when such a server is in place, otherwise downloads will be empty.
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
+
+# Directory with files generated by the agent
+BLOB_FOLDER = os.path.abspath("./blob_storage")
 
 # Configure logging
 logging.basicConfig(
@@ -47,11 +79,14 @@ app.register_blueprint(chat_bp)
 app.register_blueprint(api_bp, url_prefix='/api')
 
 @app.route('/blob_storage/<path:filename>')
+@app.route('/blob/<path:filename>')
 def serve_blob(filename):
     """Serve files from the /blob_storage directory."""
-    blob_folder = os.path.abspath("./blob_storage")  # Use absolute path
-    logger.info(f"Serving file from: {os.path.join(blob_folder, filename)}")
-    return send_from_directory(blob_folder, filename)
+    logger.debug("Serving file from: %s", os.path.join(BLOB_FOLDER, filename))
+    # Conditional responses let clients revalidate (304) or fetch ranges instead of
+    # re-downloading; the file itself is handed to the server's file wrapper
+    # (sendfile where supported) rather than read into memory
+    return send_from_directory(BLOB_FOLDER, filename, conditional=True)
 
 @app.route('/')
 def index():
@@ -4,26 +4,27 @@ Configuration module for the Catalyst Web UI.
 This module provides configuration settings for the Flask application.
 """
 
-import os
 from pathlib import Path
 from dotenv import load_dotenv
+from catalyst_web import envs
+
+# Load environment variables from .env file if it exists (once, at import)
+_ENV_PATH = Path(__file__).parent.parent / '.env'
+if _ENV_PATH.exists():
+    load_dotenv(_ENV_PATH)
+
 
 class Config:
     """Base configuration class for the Catalyst Web UI."""
     
-    # Load environment variables from .env file if it exists
-    env_path = Path(__file__).parent.parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-    
     # Flask configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY', 'catalyst-dev-key-change-in-production')
-    DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() in ['true', '1', 't']
+    SECRET_KEY = envs.SECRET_KEY
+    DEBUG = envs.FLASK_DEBUG
     TESTING = False
     
     # Server configuration
-    HOST = os.environ.get('HOST', '0.0.0.0')
-    PORT = int(os.environ.get('PORT', 5000))
+    HOST = envs.HOST
+    PORT = envs.PORT
     
     # Session configuration
     SESSION_TYPE = 'filesystem'
@@ -35,10 +36,10 @@ class Config:
     API_PREFIX = f'/api/{API_VERSION}'
     
     # Catalyst core integration
-    CORE_ENABLED = os.environ.get('CORE_ENABLED', 'False').lower() in ['true', '1', 't']
+    CORE_ENABLED = envs.CORE_ENABLED
     
     # Logging configuration
-    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    LOG_LEVEL = envs.LOG_LEVEL
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     # Static assets
@@ -94,5 +95,4 @@ config = {
 # Get the active configuration
 def get_config():
     """Get the active configuration based on environment variables."""
-    env = os.environ.get('FLASK_ENV', 'development').lower()
-    return config.get(env, config['default'])
\ No newline at end of file
+    return config.get(envs.FLASK_ENV, config['default'])
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Environment variables used by the Catalyst Web UI.
+
+All settings read from the environment are declared here, together with their
+defaults and how they are parsed. Access them as module attributes
+(e.g. ``envs.PORT``); each value is parsed on first access and then cached.
+"""
+
+import os
+from typing import Any, Callable, Dict
+
+
+def _get_bool(name: str, default: str = 'False') -> bool:
+    """Parse a boolean environment variable ('true', '1' or 't', case-insensitive)."""
+    return os.environ.get(name, default).lower() in ['true', '1', 't']
+
+
+environment_variables: Dict[str, Callable[[], Any]] = {
+    # Flask configuration
+    'SECRET_KEY': lambda: os.environ.get('SECRET_KEY', 'catalyst-dev-key-change-in-production'),
+    'FLASK_DEBUG': lambda: _get_bool('FLASK_DEBUG'),
+    'FLASK_ENV': lambda: os.environ.get('FLASK_ENV', 'development').lower(),
+    
+    # Server configuration
+    'HOST': lambda: os.environ.get('HOST', '0.0.0.0'),
+    'PORT': lambda: int(os.environ.get('PORT', 5000)),
+    
+    # Catalyst core integration
+    'CORE_ENABLED': lambda: _get_bool('CORE_ENABLED'),
+    
+    # Logging configuration
+    'LOG_LEVEL': lambda: os.environ.get('LOG_LEVEL', 'INFO').upper(),
+}
+
+_cache: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    if name in environment_variables:
+        if name not in _cache:
+            _cache[name] = environment_variables[name]()
+        return _cache[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return list(environment_variables.keys())
@@ -40,19 +40,20 @@ class ChatService:
         except Exception as e:
             logger.error(f"Failed to initialize Azure OpenAI client: {str(e)}")
         
-        # Initialize the Catalyst Core agent if available
-        try:
-            logger.info("Initializing Catalyst Core agent")
-            # Read LLM_PROVIDER from environment when creating config
-            llm_provider_env = os.getenv("LLM_PROVIDER", "azure") # Default to azure if not set
-            logger.info(f"ChatService using LLM_PROVIDER from env: {llm_provider_env}")
-            config = AgentConfig(
-                blob_storage_path="./blob_storage",
-                llm_provider=llm_provider_env
-            )
-            self.agent = AgentCore(config)
-        except Exception as e:
-            logger.error(f"Failed to initialize Catalyst Core agent: {str(e)}")
+        # Initialize the Catalyst Core agent if one wasn't given
+        if self.agent is None:
+            try:
+                logger.info("Initializing Catalyst Core agent")
+                # Read LLM_PROVIDER from environment when creating config
+                llm_provider_env = os.getenv("LLM_PROVIDER", "azure") # Default to azure if not set
+                logger.info(f"ChatService using LLM_PROVIDER from env: {llm_provider_env}")
+                config = AgentConfig(
+                    blob_storage_path="./blob_storage",
+                    llm_provider=llm_provider_env
+                )
+                self.agent = AgentCore(config)
+            except Exception as e:
+                logger.error(f"Failed to initialize Catalyst Core agent: {str(e)}")
     
     def process_message(self, message_content: str, message_id: str = None) -> Dict:
         """Process a user message and return a response."""
@@ -154,12 +155,4 @@ class ChatService:
         return Response(generate(), mimetype='text/event-stream')
 
 # Create a singleton instance
-# Read LLM_PROVIDER from environment when creating config for the singleton
-llm_provider_env_singleton = os.getenv("LLM_PROVIDER", "azure")
-logger.info(f"ChatService singleton using LLM_PROVIDER from env: {llm_provider_env_singleton}")
-singleton_config = AgentConfig(
-    blob_storage_path="./blob_storage",
-    llm_provider=llm_provider_env_singleton
-)
-agent_core = AgentCore(singleton_config)
-chat_service = ChatService(agent=agent_core) # Pass the pre-configured agent
\ No newline at end of file
+chat_service = ChatService()
\ No newline at end of file
@@ -525,6 +525,7 @@ class CatalystChat {
                     case 'tool_input':
                         return;
                     case 'tool_output':
+                    case 'tool_invocation':
                         eventTypeClass = 'event-tool';
                         eventIcon = '🔧';
                         eventMessage = eventObj.metadata?.tool_name || 'tool';